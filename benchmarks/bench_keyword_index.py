@@ -0,0 +1,48 @@
+"""Сравнивает поиск по KeywordIndex с проходом filter_vacancies по всем вакансиям.
+
+    python -m benchmarks.bench_keyword_index --items 100000 --keywords 20
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.synthetic import TITLES, WORDS, iter_raw_vacancies
+from src.indexes import KeywordIndex
+from src.main import filter_vacancies
+from src.vacancies import Vacancy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--keywords", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    vacancies = Vacancy.cast_to_object_list(iter_raw_vacancies(args.items))
+    # Редкие слова из названий вперемешку с несуществующими — типичный пользовательский запрос
+    pool = [title.split()[0].lower() for title in TITLES] + [f"нет{i}" for i in range(args.keywords)] + WORDS
+    keywords = pool[: args.keywords]
+
+    start = time.perf_counter()
+    index = KeywordIndex.from_vacancies(vacancies)
+    build_seconds = time.perf_counter() - start
+
+    results = {"items": args.items, "keywords": len(keywords), "index_build_s": round(build_seconds, 3)}
+    for name, func in (
+        ("scan", lambda: filter_vacancies(vacancies, keywords)),
+        ("index", lambda: filter_vacancies(vacancies, keywords, index=index)),
+        ("index_all", lambda: index.search(keywords[:2], match_all=True)),
+    ):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            matched = len(func())
+            timings.append(time.perf_counter() - start)
+        results[name] = {"matched": matched, "best_ms": round(min(timings) * 1000, 3)}
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
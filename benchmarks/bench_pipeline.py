@@ -0,0 +1,108 @@
+"""Сквозной бенчмарк: загрузка с локального сервера → разбор → сохранение в JSON → запросы.
+
+Для каждого размера выборки измеряются этапы и печатается JSON-отчёт, который можно
+сохранять между релизами и сравнивать. Размер 1 000 000 требует нескольких ГБ памяти
+и занимает минуты; одиночные add_vacancy/delete_vacancy переписывают весь файл, поэтому
+их стоимость измеряется на --ops вызовах поверх заполненного хранилища.
+
+    python -m benchmarks.bench_pipeline --sizes 1000 100000 1000000 --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import partial
+from typing import Callable, Dict, List, TypeVar
+
+from benchmarks.stub_server import StubServer, query_names
+from src.api_interactions import HeadHunterAPI
+from src.filehandler import JSONSaver
+from src.main import filter_vacancies, get_top_vacancies, get_vacancies_by_salary, sort_vacancies
+from src.vacancies import Vacancy
+
+T = TypeVar("T")
+
+KEYWORDS = ["python"]
+MIN_SALARY = "100000"
+TOP_N = 10
+
+
+def timed(stages: Dict[str, Dict], name: str, func: Callable[[], T], items: int) -> T:
+    """Выполняет этап, записывает время и время на элемент (или на вызов)"""
+    start = time.perf_counter()
+    result = func()
+    seconds = time.perf_counter() - start
+    per_item = round(seconds / max(items, 1) * 1e6, 3)
+    stages[name] = {"seconds": round(seconds, 4), "items": items, "us_per_item": per_item}
+    return result
+
+
+def fetch(base_url: str, total: int, workers: int) -> List[Dict]:
+    """Выкачивает все вакансии сервера тем же путём, что и приложение"""
+    hh_api = HeadHunterAPI(max_workers=workers, base_url=base_url)
+    with hh_api:
+        hh_api.connect()
+        return [item for query in query_names(total) for item in hh_api.iter_vacancies(query)]
+
+
+def run_size(total: int, ops: int, workers: int, workdir: str) -> Dict:
+    stages: Dict[str, Dict] = {}
+    with StubServer(total) as base_url:
+        raw = timed(stages, "fetch", lambda: fetch(base_url, total, workers), total)
+
+    vacancies = timed(stages, "cast_to_object_list", partial(Vacancy.cast_to_object_list, raw), len(raw))
+    del raw
+
+    filename = os.path.join(workdir, f"vacancies_{total}.json")
+    saver = JSONSaver(filename)
+    head, tail = vacancies[: len(vacancies) - ops], vacancies[len(vacancies) - ops:]
+    timed(stages, "add_vacancies", lambda: saver.add_vacancies(head), len(head))
+    timed(stages, "add_vacancy", lambda: [saver.add_vacancy(v) for v in tail], len(tail))
+    file_size_mb = round(os.path.getsize(filename) / 2**20, 2)
+
+    stored = timed(stages, "get_vacancies", saver.get_vacancies, len(vacancies))
+    timed(stages, "get_vacancies_keywords", lambda: saver.get_vacancies(keywords=KEYWORDS), len(vacancies))
+    timed(stages, "get_vacancies_salary", lambda: saver.get_vacancies(salary_range="100000-200000"), len(vacancies))
+    timed(stages, "delete_vacancy", lambda: [saver.delete_vacancy(v) for v in tail], len(tail))
+
+    filtered = timed(stages, "filter_vacancies", lambda: filter_vacancies(stored, KEYWORDS), len(stored))
+    by_salary = timed(
+        stages, "get_vacancies_by_salary", lambda: get_vacancies_by_salary(filtered, MIN_SALARY), len(filtered)
+    )
+    ordered = timed(stages, "sort_vacancies", lambda: sort_vacancies(by_salary), len(by_salary))
+    timed(stages, "get_top_vacancies", lambda: get_top_vacancies(ordered, TOP_N), TOP_N)
+    os.remove(filename)
+    return {"size": total, "vacancies": len(vacancies), "file_size_mb": file_size_mb, "stages": stages}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--ops", type=int, default=10, help="число одиночных add_vacancy и delete_vacancy")
+    parser.add_argument("--workers", type=int, default=8, help="потоков загрузки страниц")
+    parser.add_argument("--output", help="файл для JSON-отчёта (по умолчанию — stdout)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [run_size(size, args.ops, args.workers, workdir) for size in args.sizes]
+    report = {
+        "benchmark": "pipeline",
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
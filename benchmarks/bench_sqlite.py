@@ -0,0 +1,80 @@
+"""Сравнивает фильтрованные запросы SQLiteSaver с полным проходом по записям, как в JSONSaver.
+
+    python -m benchmarks.bench_sqlite --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.synthetic import iter_raw_vacancies
+from src.filehandler import FileHandler, SQLiteSaver
+from src.vacancies import Vacancy
+
+QUERIES = [
+    {"keywords": ["python"], "salary_range": None},
+    {"keywords": None, "salary_range": "200000-250000"},
+    {"keywords": ["docker", "бухгалтер"], "salary_range": "100000-300000"},
+    {"keywords": ["аналитик"], "salary_range": "300000-310000"},
+]
+
+
+def scan(records: List[Dict], keywords: Optional[List[str]], salary_range: Optional[str]) -> List[Vacancy]:
+    """Тот же проход, что в JSONSaver.get_vacancies, но без чтения файла"""
+    matches = FileHandler._record_filter(keywords, salary_range)
+    return [Vacancy(**r) for r in records if matches(r)]
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """Минимальное время выполнения из repeat запусков, в миллисекундах"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return round(min(timings) * 1000, 3)
+
+
+def run(size: int, directory: str) -> List[Dict]:
+    vacancies = Vacancy.cast_to_object_list(iter_raw_vacancies(size))
+    records = [FileHandler._to_dict(v) for v in vacancies]
+    del vacancies
+
+    saver = SQLiteSaver(os.path.join(directory, f"bench_{size}.db"))
+    start = time.perf_counter()
+    saver.add_vacancies(Vacancy(**record) for record in records)
+    load_seconds = time.perf_counter() - start
+
+    results = []
+    for query in QUERIES:
+        scan_ms = best_of(lambda: scan(records, query["keywords"], query["salary_range"]))
+        sqlite_ms = best_of(lambda: saver.get_vacancies(query["keywords"], query["salary_range"]))
+        results.append({
+            "rows": size,
+            "query": query,
+            "matched": len(saver.get_vacancies(query["keywords"], query["salary_range"])),
+            "scan_ms": scan_ms,
+            "sqlite_ms": sqlite_ms,
+            "sqlite_load_s": round(load_seconds, 2),
+        })
+    saver.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            results.extend(run(size, directory))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
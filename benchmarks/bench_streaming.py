@@ -0,0 +1,91 @@
+"""Сравнивает пиковое потребление памяти потокового и спискового конвейера.
+
+Каждый режим запускается в отдельном процессе, так как ru_maxrss растёт монотонно.
+
+    python -m benchmarks.bench_streaming --items 100000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.synthetic import iter_raw_pages
+from src.filehandler import FileHandler
+from src.main import filter_vacancies
+from src.vacancies import Vacancy
+
+
+class NullSaver(FileHandler):
+    """Хранилище, которое только считает вакансии: измеряется сам конвейер, а не формат файла"""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.count += 1
+
+    def get_vacancies(self, keywords: Optional[List[str]] = None, salary_range: Optional[str] = None) -> List[Vacancy]:
+        return []
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        pass
+
+
+def run_list(items: int) -> int:
+    """Текущий путь: все страницы в список, затем список Vacancy, затем сохранение по одной"""
+    raw = [item for page in iter_raw_pages(items) for item in page]
+    vacancies = Vacancy.cast_to_object_list(raw)
+    saver = NullSaver()
+    for vacancy in vacancies:
+        saver.add_vacancy(vacancy)
+    return len(filter_vacancies(vacancies, ["python"]))
+
+
+def run_stream(items: int) -> int:
+    """Потоковый путь: страницы → генератор Vacancy → пакетное сохранение → фильтр"""
+    raw = (item for page in iter_raw_pages(items) for item in page)
+    saver = NullSaver()
+    return len(filter_vacancies(saver.add_stream(Vacancy.iter_from_raw(raw)), ["python"]))
+
+
+def measure(mode: str, items: int) -> Dict:
+    """Выполняет один режим в текущем процессе и возвращает метрики"""
+    start = time.perf_counter()
+    matched = (run_stream if mode == "stream" else run_list)(items)
+    return {
+        "mode": mode,
+        "items": items,
+        "matched": matched,
+        "seconds": round(time.perf_counter() - start, 3),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--mode", choices=["list", "stream"], help="запустить один режим в этом процессе")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(measure(args.mode, args.items)))
+        return
+
+    results = []
+    for mode in ("list", "stream"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_streaming", "--mode", mode, "--items", str(args.items)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output))
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Микробенчмарки объекта Vacancy: создание, доступ к атрибутам и память на объект.
+
+    python -m benchmarks.bench_vacancy --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks.synthetic import iter_raw_vacancies
+from src.filehandler import FileHandler
+from src.vacancies import Vacancy
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Время выполнения с отключённым сборщиком мусора, как в timeit"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def measure_access(vacancies: List[Vacancy]) -> Dict[str, float]:
+    """Наносекунд на объект для чтения атрибутов и сортировки по зарплате"""
+    access = {
+        "title_property": lambda: [v.title for v in vacancies],
+        "salary_property": lambda: [v.salary for v in vacancies],
+        "normalized_salary_first": lambda: [v.normalized_salary for v in vacancies],
+        "normalized_salary_cached": lambda: [v.normalized_salary for v in vacancies],
+        "sort_by_normalized_salary": lambda: sorted(vacancies, key=lambda v: v.normalized_salary),
+    }
+    return {name: round(timed(read) / len(vacancies) * 1e9, 1) for name, read in access.items()}
+
+
+def measure_memory(build: Callable[[], List[Vacancy]]) -> float:
+    """Байт на объект: прирост памяти, пока живут созданные объекты (исходные данные уже в памяти)"""
+    gc.collect()
+    tracemalloc.start()
+    vacancies = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(vacancies)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    raw = list(iter_raw_vacancies(args.count))
+    vacancies = Vacancy.cast_to_object_list(raw)
+    records: List[Dict] = [FileHandler._to_dict(v) for v in vacancies]
+    count = len(records)
+
+    results: Dict[str, object] = {"count": count}
+    construction = {
+        "cast_to_object_list": lambda: Vacancy.cast_to_object_list(raw),
+        "validated_init": lambda: [Vacancy(**r) for r in records],
+        "from_record": lambda: [Vacancy.from_record(r) for r in records],
+    }
+    results["construction_us_per_object"] = {
+        name: round(timed(build) / count * 1e6, 3) for name, build in construction.items()
+    }
+
+    results["access_ns_per_object"] = measure_access(vacancies)
+
+    del vacancies
+    results["memory_bytes_per_object"] = {
+        "validated_init": round(measure_memory(lambda: [Vacancy(**r) for r in records])),
+        "from_record": round(measure_memory(lambda: [Vacancy.from_record(r) for r in records])),
+    }
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
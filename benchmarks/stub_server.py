@@ -0,0 +1,80 @@
+"""Локальный сервер в формате API hh.ru для бенчмарков.
+
+Вакансии делятся на запросы «bench-0», «bench-1», ... по MAX_DEPTH штук, как ограничивает
+глубину выдачи настоящий API. Страницы заранее сериализуются в отдельном процессе, поэтому
+генерация данных и работа сервера не отнимают время и GIL у измеряемого клиента.
+"""
+
+import json
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.synthetic import iter_raw_pages
+from src.api_interactions import HeadHunterAPI
+
+QUERY_PREFIX = "bench-"
+EMPTY_PAGE = json.dumps({"items": [], "found": 0, "pages": 0, "page": 0, "per_page": 0}).encode()
+
+
+def query_names(total: int) -> List[str]:
+    """Запросы, которыми выкачиваются все total вакансий сервера"""
+    return [f"{QUERY_PREFIX}{number}" for number in range(-(-total // HeadHunterAPI.MAX_DEPTH))]
+
+
+def render_pages(total: int, per_page: int = 100, seed: int = 17) -> Dict[Tuple[str, int], bytes]:
+    """Готовые тела ответов по ключу (запрос, номер страницы)"""
+    pages_per_query = HeadHunterAPI.MAX_DEPTH // per_page
+    raw_pages = list(iter_raw_pages(total, per_page, seed))
+    bodies = {}
+    for number, items in enumerate(raw_pages):
+        query, page = divmod(number, pages_per_query)
+        query_pages = min(pages_per_query, len(raw_pages) - query * pages_per_query)
+        body = {"items": items, "found": total, "pages": query_pages, "page": page, "per_page": per_page}
+        bodies[(f"{QUERY_PREFIX}{query}", page)] = json.dumps(body, ensure_ascii=False).encode()
+    return bodies
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    pages: Dict[Tuple[str, int], bytes] = {}
+
+    def do_GET(self) -> None:
+        query = parse_qs(urlparse(self.path).query)
+        key = (query.get("text", [""])[0], int(query.get("page", ["0"])[0]))
+        body = self.pages.get(key, EMPTY_PAGE)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _serve(total: int, seed: int, ready: "multiprocessing.Queue") -> None:
+    StubHandler.pages = render_pages(total, seed=seed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StubServer:
+    """Запускает сервер в отдельном процессе; в блоке with отдаёт base_url для HeadHunterAPI"""
+
+    def __init__(self, total: int, seed: int = 17):
+        self._total = total
+        self._seed = seed
+        self._process: Optional[multiprocessing.Process] = None
+
+    def __enter__(self) -> str:
+        ready: multiprocessing.Queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(self._total, self._seed, ready), daemon=True)
+        self._process.start()
+        return f"http://127.0.0.1:{ready.get()}/vacancies"
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
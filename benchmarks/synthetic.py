@@ -0,0 +1,50 @@
+"""Генераторы синтетических данных в формате ответов hh.ru для бенчмарков"""
+
+import random
+from typing import Dict, Iterator, List
+
+TITLES = ["Python разработчик", "Java Developer", "Бухгалтер", "Аналитик данных", "DevOps инженер", "Менеджер"]
+WORDS = ["опыт", "python", "django", "sql", "docker", "linux", "команда", "отчётность", "excel", "api"]
+CURRENCIES = ["RUR", "RUR", "RUR", "USD", "EUR", "KZT"]
+
+
+def make_raw_vacancy(index: int, rng: random.Random) -> Dict:
+    """Создаёт одну вакансию в формате элемента items из ответа hh.ru"""
+    salary_from = rng.choice([None, rng.randrange(30_000, 400_000, 5_000)])
+    salary_to = rng.choice([None, (salary_from or 50_000) + rng.randrange(0, 150_000, 5_000)])
+    salary = None
+    if salary_from is not None or salary_to is not None:
+        currency = rng.choice(CURRENCIES)
+        salary = {"from": salary_from, "to": salary_to, "currency": currency, "gross": rng.random() < 0.5}
+    return {
+        "id": str(100_000_000 + index),
+        "name": f"{rng.choice(TITLES)} {index}",
+        "alternate_url": f"https://hh.ru/vacancy/{100_000_000 + index}",
+        "salary": salary,
+        "published_at": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00+0300",
+        "employer": {"name": f"Компания {index % 500}"},
+        "area": {"name": rng.choice(["Москва", "Санкт-Петербург", "Казань", "Алматы"])},
+        "snippet": {
+            "requirement": " ".join(rng.choices(WORDS, k=12)),
+            "responsibility": " ".join(rng.choices(WORDS, k=12)),
+        },
+    }
+
+
+def iter_raw_vacancies(total: int, seed: int = 17) -> Iterator[Dict]:
+    """Лениво генерирует total вакансий; при одинаковом seed данные совпадают"""
+    rng = random.Random(seed)
+    for index in range(total):
+        yield make_raw_vacancy(index, rng)
+
+
+def iter_raw_pages(total: int, per_page: int = 100, seed: int = 17) -> Iterator[List[Dict]]:
+    """Генерирует вакансии страницами по per_page, как их отдаёт API"""
+    page: List[Dict] = []
+    for item in iter_raw_vacancies(total, seed):
+        page.append(item)
+        if len(page) == per_page:
+            yield page
+            page = []
+    if page:
+        yield page
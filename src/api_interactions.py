@@ -1,7 +1,21 @@
+import asyncio
+import json
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.http_cache import ResponseCache
+from src.metrics import Metrics
 
 
 class VacancyAPI(ABC):
@@ -16,19 +30,259 @@ class VacancyAPI(ABC):
         pass
 
 
+class RateLimiter:
+    """Общий для всех потоков token bucket, который подстраивается под ответы 429.
+
+    rate — запросов в секунду (None — без ограничения), burst — сколько запросов можно отправить
+    подряд без ожидания. На 429 все потоки ставятся на паузу (Retry-After или переданная задержка),
+    а скорость уменьшается в decrease раз — один раз за паузу, сколько бы параллельных запросов
+    ни получили 429 в ответ на неё; после каждого успешного ответа она растёт на increase
+    запросов в секунду за секунду, но не выше исходного rate (AIMD, как в TCP).
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = 1.0,
+        min_rate: float = 0.5,
+        decrease: float = 0.5,
+        increase: float = 1.0,
+    ):
+        self._max_rate = rate
+        self._rate = rate
+        self._burst = burst
+        self._min_rate = min_rate
+        self._decrease = decrease
+        self._increase = increase
+        self._tat = 0.0  # теоретическое время следующего запроса (GCRA, эквивалент token bucket)
+        self._paused_until = 0.0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._last_window_rate = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    def acquire(self) -> None:
+        """Ждёт, пока можно будет отправить следующий запрос"""
+        with self._lock:
+            now = time.monotonic()
+            if self._rate is None:
+                self._count_unlimited(now)
+                wait = self._tat - now
+            else:
+                interval = 1.0 / self._rate
+                tat = max(self._tat, now)
+                wait = tat - now - (self._burst - 1) * interval
+                self._tat = tat + interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _count_unlimited(self, now: float) -> None:
+        """Без ограничения считает фактическую частоту, чтобы после первого 429 начать с неё"""
+        elapsed = now - self._window_start
+        if elapsed > 1.0:
+            self._last_window_rate = self._window_count / elapsed
+            self._window_start, self._window_count = now, 0
+        self._window_count += 1
+
+    def _observed_rate(self, now: float) -> float:
+        """Фактическая частота запросов, измеренная на окне не короче секунды"""
+        current = self._window_count / max(now - self._window_start, 1.0)
+        return max(current, self._last_window_rate)
+
+    def on_success(self) -> None:
+        """Аддитивно поднимает скорость после успешного ответа"""
+        if self._rate is None:
+            return
+        with self._lock:
+            rate = self._rate + self._increase / self._rate
+            self._rate = min(rate, self._max_rate) if self._max_rate is not None else rate
+
+    def on_throttle(self, delay: float) -> None:
+        """Ответ 429: пауза для всех потоков на delay секунд и мультипликативное снижение скорости"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return  # ответ на запрос, отправленный до паузы: скорость уже снижена
+            if self._rate is None:
+                self._rate = self._observed_rate(now)
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+            self._paused_until = now + delay
+            self._tat = max(self._tat, now + delay + (self._burst - 1) / self._rate)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Разбирает заголовок Retry-After: число секунд или HTTP-дата"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 class HeadHunterAPI(VacancyAPI):
-    def __init__(self):
-        self._base_url = "https://api.hh.ru/vacancies"
+    """Клиент hh.ru с пулом соединений, повторами и общим для потоков ограничением частоты.
+
+    Таймауты соединения и чтения задаются timeout. Обрывы соединения, таймауты и ответы
+    429/5xx повторяются до max_retries раз с экспоненциальной задержкой и случайным разбросом
+    (full jitter); если сервер прислал Retry-After, ждём столько, сколько он просит.
+    """
+
+    MAX_DEPTH = 2000  # hh.ru отдаёт не больше 2000 вакансий на один запрос
+    PER_PAGE = 100
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        requests_per_second: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        base_url: str = "https://api.hh.ru/vacancies",
+        metrics: Optional[Metrics] = None,
+        timeout: Union[float, Tuple[float, float]] = (3.05, 10.0),
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self._base_url = base_url
         self._headers = {"User-Agent": "HH-User-Agent"}
-        self._params = {"text": "", "per_page": 100}
+        self._params = {"text": "", "per_page": self.PER_PAGE}
         self._connected = False
+        self._max_workers = max_workers
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(requests_per_second)
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._session: Optional[requests.Session] = None
+        self._cache = cache
+        self._metrics = metrics if metrics is not None else Metrics()
+
+    def __enter__(self) -> "HeadHunterAPI":
+        self.open_session()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open_session(self) -> requests.Session:
+        """Открывает общую keep-alive сессию с пулом соединений на max_workers"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self._headers)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Закрывает сессию и освобождает соединения"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _get(self, params: Dict, headers: Optional[Dict] = None) -> requests.Response:
+        """Выполняет GET-запрос через сессию, если она открыта, иначе отдельным соединением.
+
+        Повторяет запрос при обрыве, таймауте и ответах из RETRY_STATUSES; если попытки кончились,
+        возвращает последний ответ (его проверит raise_for_status) или бросает последнюю ошибку.
+        """
+        headers = headers or self._headers
+        attempt = 0
+        while True:
+            self._rate_limiter.acquire()
+            try:
+                response = self._send(params, headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == self._max_retries:
+                    raise
+                self._metrics.inc("hh_http_retries_total", reason=type(e).__name__)
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES:
+                self._rate_limiter.on_success()
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if response.status_code == 429:
+                self._rate_limiter.on_throttle(delay)  # пауза для всех потоков, ждём в acquire()
+            if attempt == self._max_retries:
+                return response
+            self._metrics.inc("hh_http_retries_total", reason=response.status_code)
+            if response.status_code != 429:
+                time.sleep(delay)
+            attempt += 1
+
+    def _send(self, params: Dict, headers: Dict) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            if self._session is not None:
+                response = self._session.get(self._base_url, headers=headers, params=params, timeout=self._timeout)
+            else:
+                response = requests.get(self._base_url, headers=headers, params=params, timeout=self._timeout)
+        except requests.exceptions.RequestException as e:
+            self._metrics.inc("hh_http_errors_total", error=type(e).__name__)
+            raise
+        if self._metrics.enabled:
+            self._metrics.observe("hh_http_request_seconds", time.perf_counter() - start)
+            self._metrics.inc("hh_http_requests_total", status=response.status_code)
+            self._metrics.inc("hh_http_response_bytes_total", len(response.content))
+        return response
+
+    def _backoff(self, attempt: int) -> float:
+        """Экспоненциальная задержка с полным случайным разбросом"""
+        return random.uniform(0, min(self._max_backoff, self._backoff_factor * 2**attempt))
+
+    def _get_json(self, params: Dict) -> Dict:
+        """Возвращает JSON ответа, по возможности из кэша; при ошибке HTTP бросает RequestException"""
+        if self._cache is None:
+            response = self._get(params)
+            response.raise_for_status()
+            data: Dict = response.json()
+            return data
+
+        key = self._cache.make_key(self._base_url, params)
+        entry = self._cache.get(key)
+        if entry is not None and self._cache.is_fresh(entry):
+            self._metrics.inc("hh_cache_hits_total", result="fresh")
+            data = json.loads(entry.body)
+            return data
+
+        headers = dict(self._headers)
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        response = self._get(params, headers)
+        if response.status_code == 304 and entry is not None:
+            self._metrics.inc("hh_cache_hits_total", result="revalidated")
+            self._cache.touch(key)
+            data = json.loads(entry.body)
+            return data
+
+        response.raise_for_status()
+        self._cache.put(key, response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        data = response.json()
+        return data
 
     def connect(self) -> None:
         """Проверяет подключение к API hh.ru"""
         try:
             test_params = {"text": "test", "per_page": 1}
-            response = requests.get(self._base_url, headers=self._headers, params=test_params)
-            response.raise_for_status()  # Проверяет статус ответа
+            self._get_json(test_params)  # Проверяет статус ответа; свежий ответ из кэша не тратит запрос
             self._connected = True
         except requests.exceptions.RequestException as e:
             print(f"Ошибка подключения к hh.ru: {e}")
@@ -42,9 +296,146 @@ class HeadHunterAPI(VacancyAPI):
 
         self._params["text"] = search_query
         try:
-            response = requests.get(self._base_url, headers=self._headers, params=self._params)
-            response.raise_for_status()
-            return response.json().get("items", [])
+            return self._get_json(self._params).get("items", [])
         except requests.exceptions.RequestException as e:
             print(f"Ошибка при получении данных: {e}")
             return []
+
+    def _fetch_page(
+        self, search_query: str, page: int, extra_params: Optional[Dict] = None, strict: bool = False
+    ) -> Dict:
+        """Загружает одну страницу выдачи; при ошибке возвращает пустую страницу, а в режиме strict бросает её"""
+        params = {**self._params, **(extra_params or {}), "text": search_query, "page": page}
+        try:
+            return self._get_json(params)
+        except requests.exceptions.RequestException as e:
+            self._metrics.inc("hh_failed_pages_total")
+            if strict:
+                raise
+            print(f"Ошибка при получении страницы {page}: {e}")
+            return {}
+
+    def iter_pages(
+        self, search_query: str, extra_params: Optional[Dict] = None, strict: bool = False
+    ) -> Iterator[List[Dict]]:
+        """Отдаёт страницы выдачи по мере загрузки, сохраняя порядок страниц.
+
+        В extra_params можно передать дополнительные параметры поиска hh.ru, например date_from.
+        С strict=True ошибка загрузки страницы не пропускается, а бросается RequestException —
+        так вызывающий код узнаёт, что выдача неполная.
+        """
+        if not self._connected:
+            print("Подключение к API не установлено.")
+            return
+
+        own_session = self._session is None
+        self.open_session()
+        try:
+            first_page = self._fetch_page(search_query, 0, extra_params, strict)
+            yield first_page.get("items", [])
+
+            pages = min(first_page.get("pages", 1), self.MAX_DEPTH // self.PER_PAGE)
+            if pages > 1:
+                with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                    fetch = partial(self._fetch_page, search_query, extra_params=extra_params, strict=strict)
+                    for page in executor.map(fetch, range(1, pages)):
+                        yield page.get("items", [])
+        finally:
+            if own_session:
+                self.close()
+
+    def iter_vacancies(
+        self, search_query: str, extra_params: Optional[Dict] = None, strict: bool = False
+    ) -> Iterator[Dict]:
+        """Отдаёт вакансии по одной со всех страниц выдачи"""
+        for page in self.iter_pages(search_query, extra_params, strict):
+            yield from page
+
+    def get_all_vacancies(self, search_query: str) -> List[Dict]:
+        """Получает все страницы выдачи параллельно и возвращает вакансии в порядке страниц"""
+        return list(self.iter_vacancies(search_query))
+
+
+class AsyncHeadHunterAPI(VacancyAPI):
+    """Асинхронный клиент hh.ru: много запросов и страниц на одном event loop"""
+
+    MAX_DEPTH = HeadHunterAPI.MAX_DEPTH
+    PER_PAGE = HeadHunterAPI.PER_PAGE
+
+    def __init__(self, max_connections: int = 20, base_url: str = "https://api.hh.ru/vacancies"):
+        self._base_url = base_url
+        self._headers = {"User-Agent": "HH-User-Agent"}
+        self._params: Dict[str, Union[str, int]] = {"text": "", "per_page": self.PER_PAGE}
+        self._connected = False
+        self._max_connections = max_connections
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Создаёт сессию с пулом не более чем на max_connections соединений"""
+        connector = aiohttp.TCPConnector(limit=self._max_connections)
+        return aiohttp.ClientSession(connector=connector, headers=self._headers)
+
+    async def aconnect(self) -> None:
+        """Проверяет подключение к API hh.ru"""
+        try:
+            async with self._create_session() as session:
+                async with session.get(self._base_url, params={"text": "test", "per_page": 1}) as response:
+                    response.raise_for_status()
+            self._connected = True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Ошибка подключения к hh.ru: {e}")
+            self._connected = False
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, search_query: str, page: int
+    ) -> Dict:
+        """Загружает одну страницу выдачи; при ошибке возвращает пустую страницу"""
+        params = {**self._params, "text": search_query, "page": page}
+        async with semaphore:
+            try:
+                async with session.get(self._base_url, params=params) as response:
+                    response.raise_for_status()
+                    data: Dict = await response.json()
+                    return data
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Ошибка при получении страницы {page} запроса '{search_query}': {e}")
+                return {}
+
+    async def _fetch_query(
+        self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, search_query: str
+    ) -> List[Dict]:
+        """Загружает все страницы одного запроса в порядке страниц"""
+        first_page = await self._fetch_page(session, semaphore, search_query, 0)
+        pages = min(first_page.get("pages", 1), self.MAX_DEPTH // self.PER_PAGE)
+
+        items = list(first_page.get("items", []))
+        rest = await asyncio.gather(
+            *(self._fetch_page(session, semaphore, search_query, page) for page in range(1, pages))
+        )
+        for page in rest:
+            items.extend(page.get("items", []))
+        return items
+
+    async def fetch_many(self, search_queries: List[str]) -> Dict[str, List[Dict]]:
+        """Параллельно загружает все страницы для каждого запроса"""
+        if not self._connected:
+            print("Подключение к API не установлено.")
+            return {query: [] for query in search_queries}
+
+        semaphore = asyncio.Semaphore(self._max_connections)
+        async with self._create_session() as session:
+            results = await asyncio.gather(
+                *(self._fetch_query(session, semaphore, query) for query in search_queries)
+            )
+        return dict(zip(search_queries, results))
+
+    def connect(self) -> None:
+        """Синхронная обёртка над aconnect"""
+        asyncio.run(self.aconnect())
+
+    def get_vacancies(self, search_query: str) -> List[Dict]:
+        """Получает все вакансии по поисковому запросу"""
+        return self.get_many_vacancies([search_query])[search_query]
+
+    def get_many_vacancies(self, search_queries: List[str]) -> Dict[str, List[Dict]]:
+        """Синхронная обёртка над fetch_many для скриптов без event loop"""
+        return asyncio.run(self.fetch_many(search_queries))
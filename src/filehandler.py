@@ -1,10 +1,48 @@
 import json
 import os
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Set, Tuple
 
+from src.indexes import KeywordIndex, SalaryIndex
+from src.metrics import Metrics
+from src.salary import Salary, normalized_amount
+from src.snapshot import VacancySnapshot, write_snapshot
 from src.vacancies import Vacancy
 
+fcntl: Optional[ModuleType]
+try:
+    import fcntl
+except ImportError:  # Windows: остаётся только блокировка между потоками одного процесса
+    fcntl = None
+
+
+@contextmanager
+def file_lock(filename: str) -> Iterator[None]:
+    """Эксклюзивная рекомендательная блокировка файла между процессами через соседний файл .lock"""
+    with open(f"{filename}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@dataclass
+class _CommitRequest:
+    """Пачка одного потока в очереди групповой записи JSONSaver"""
+
+    vacancies: List[Vacancy]
+    done: bool = False
+    error: Optional[Exception] = None
+    added: int = 0
+
 
 class FileHandler(ABC):
     @abstractmethod
@@ -22,46 +60,322 @@ class FileHandler(ABC):
         """Удаляет вакансию из файла"""
         pass
 
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """Добавляет несколько вакансий в файл; возвращает число сохранённых вакансий.
+
+        Реализация по умолчанию дубли не отсекает и считает сохранённой каждую переданную вакансию.
+        """
+        added = 0
+        for vacancy in vacancies:
+            self.add_vacancy(vacancy)
+            added += 1
+        return added
+
+    def add_stream(self, vacancies: Iterable[Vacancy], batch_size: int = 500) -> Iterator[Vacancy]:
+        """Пропускает поток вакансий дальше, сохраняя их пачками по batch_size"""
+        batch: List[Vacancy] = []
+        for vacancy in vacancies:
+            batch.append(vacancy)
+            yield vacancy
+            if len(batch) >= batch_size:
+                self.add_vacancies(batch)
+                batch = []
+        if batch:
+            self.add_vacancies(batch)
+
+    def add_batches(self, vacancies: Iterable[Vacancy], batch_size: int = 500) -> int:
+        """Сохраняет поток пачками по batch_size; возвращает число сохранённых вакансий.
+
+        Поток читается вне блокировки хранилища: если он медленный (например, загружает страницы
+        из сети), другие процессы могут писать в хранилище между пачками.
+        """
+        added = 0
+        batch: List[Vacancy] = []
+        for vacancy in vacancies:
+            batch.append(vacancy)
+            if len(batch) >= batch_size:
+                added += self.add_vacancies(batch)
+                batch = []
+        if batch:
+            added += self.add_vacancies(batch)
+        return added
+
+    def delete_vacancies(self, links: Iterable[str]) -> int:
+        """Удаляет вакансии по ссылкам; возвращает число удалённых. Хранилища переопределяют его
+        так, чтобы удаление шло одним проходом и одной записью"""
+        links = set(links)
+        deleted = 0
+        for vacancy in self.get_vacancies():
+            if vacancy.link in links:
+                self.delete_vacancy(vacancy)
+                deleted += 1
+        return deleted
+
+    def delete_where(
+        self, predicate: Optional[Callable[[Vacancy], bool]] = None, salary_range: Optional[str] = None
+    ) -> int:
+        """Удаляет вакансии, подходящие под все заданные условия; возвращает число удалённых"""
+        if predicate is None and not salary_range:
+            raise ValueError("Не задано ни одного условия удаления")
+        found = self.get_vacancies(salary_range=salary_range)
+        return self.delete_vacancies(v.link for v in found if predicate is None or predicate(v))
+
+    def export_snapshot(self, filename: str) -> int:
+        """Выгружает все вакансии в бинарный снимок для чтения через mmap; возвращает число записей"""
+        return write_snapshot(filename, self.get_vacancies())
+
+    @staticmethod
+    def open_snapshot(filename: str) -> VacancySnapshot:
+        """Открывает снимок только для чтения; закрывается через close() или with"""
+        return VacancySnapshot(filename)
+
+    @staticmethod
+    def _to_dict(vacancy: Vacancy) -> Dict:
+        """Преобразует вакансию в словарь для сохранения"""
+        return {
+            "title": vacancy.title,
+            "link": vacancy.link,
+            "salary": vacancy.salary,
+            "description": vacancy.description,
+            "salary_info": vacancy.salary_info.to_dict(),
+        }
+
+    @staticmethod
+    def _parse_salary_range(salary_range: str) -> Tuple[float, float]:
+        """Разбирает строку вида "100000-150000" в границы диапазона"""
+        min_sal, max_sal = map(float, salary_range.split("-"))
+        return min_sal, max_sal
+
+    @staticmethod
+    def _record_salary(item: Dict) -> float:
+        """Зарплата записи в базовой валюте; у старых записей без salary_info валюта считается рублями"""
+        salary_info = item.get("salary_info")
+        if salary_info is None:
+            return float(item["salary"])
+        return normalized_amount(salary_info)
+
+    @classmethod
+    def _record_filter(cls, keywords: Optional[List[str]], salary_range: Optional[str]) -> Callable[[Dict], bool]:
+        """Готовит проверку записи: ключевые слова и диапазон разбираются один раз на запрос"""
+        words = [word.lower() for word in keywords] if keywords else []
+        bounds = cls._parse_salary_range(salary_range) if salary_range else None
+
+        def matches(item: Dict) -> bool:
+            if words:
+                text = f"{item['title']} {item['description']}".lower()
+                if not any(word in text for word in words):
+                    return False
+            if bounds is not None and not bounds[0] <= cls._record_salary(item) <= bounds[1]:
+                return False
+            return True
+
+        return matches
+
+    @classmethod
+    def _delete_filter(
+        cls, predicate: Optional[Callable[[Vacancy], bool]], salary_range: Optional[str]
+    ) -> Callable[[Dict], bool]:
+        """Проверка записи для delete_where: сначала дешёвый фильтр по словарю, Vacancy — только для predicate"""
+        if predicate is None and not salary_range:
+            raise ValueError("Не задано ни одного условия удаления")
+        matches = cls._record_filter(None, salary_range)
+
+        def should_delete(item: Dict) -> bool:
+            return matches(item) and (predicate is None or predicate(Vacancy.from_record(item)))
+
+        return should_delete
+
 
 class JSONSaver(FileHandler):
-    def __init__(self, filename: str = "vacancies.json"):
+    """Хранит вакансии списком в JSON-файле.
+
+    Каждое изменение — это чтение, правка и запись файла под блокировкой file_lock, поэтому
+    несколько процессов могут писать в один файл без потери данных. Файл заменяется атомарно:
+    данные пишутся во временный файл, который затем переименовывается поверх основного.
+    С group_commit=True одновременные add_vacancies из разных потоков объединяются в одну запись.
+
+    В режиме cached=True разобранные записи и объекты Vacancy держатся в памяти и перечитываются,
+    только если файл изменил другой процесс (по mtime и размеру). Изменения копятся в памяти
+    до вызова flush() или выхода из блока with; если файл за это время изменили, flush применяет
+    накопленные добавления и удаления поверх свежей версии. Поиск по ключевым словам в этом режиме
+    идёт по KeywordIndex в режиме substring (вхождение подстроки, как в обычном поиске по файлу),
+    который обновляется при добавлении и удалении.
+    """
+
+    def __init__(
+        self,
+        filename: str = "vacancies.json",
+        cached: bool = False,
+        group_commit: bool = False,
+        metrics: Optional[Metrics] = None,
+    ):
         self._filename = filename
+        self._metrics = metrics if metrics is not None else Metrics()
+        self._cached = cached
+        self._group_commit = group_commit
+        self._cache: Optional[List[Dict]] = None
+        self._cache_stamp: Optional[tuple] = None
+        self._cache_objects: Dict[str, Vacancy] = {}
+        self._keyword_index: Optional[KeywordIndex] = None
+        self._salary_index: Optional[SalaryIndex] = None
+        self._dirty = False
+        self._pending_adds: Dict[str, Dict] = {}  # изменения кэша, ещё не записанные в файл
+        self._pending_deletes: Set[str] = set()
+        self._thread_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self._commit_queue: List[_CommitRequest] = []
+        self._queue_lock = threading.Lock()
         if not os.path.exists(self._filename):
             with open(self._filename, "w", encoding="utf-8") as file:
                 file.write("[]")
 
+    def __enter__(self) -> "JSONSaver":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Блокировка файла между процессами и между потоками этого объекта"""
+        with self._thread_lock, file_lock(self._filename):
+            yield
+
     def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """Добавляет вакансии за одно чтение и одну запись файла, дубли отсекаются по ссылке"""
+        if self._cached:
+            return len(self._add_records(vacancies))
+        vacancies = list(vacancies)  # поток читается до блокировки, чтобы не держать её на время чтения
+        if self._group_commit:
+            return self._group_add(vacancies)
+        with self._locked():
+            return len(self._add_records(vacancies))
+
+    def _group_add(self, vacancies: List[Vacancy]) -> int:
+        """Групповая запись: первый поток, получивший блокировку, записывает пачки всех ожидающих"""
+        request = _CommitRequest(vacancies)
+        with self._queue_lock:
+            self._commit_queue.append(request)
+        with self._commit_lock:
+            if not request.done:
+                with self._queue_lock:
+                    batch, self._commit_queue = self._commit_queue, []
+                error: Optional[Exception] = None
+                added: List[Vacancy] = []
+                try:
+                    with self._locked():
+                        added = self._add_records(vacancy for item in batch for vacancy in item.vacancies)
+                except Exception as e:
+                    error = e
+                added_ids = {id(vacancy) for vacancy in added}
+                for item in batch:
+                    item.added = sum(1 for vacancy in item.vacancies if id(vacancy) in added_ids)
+                    item.done, item.error = True, error
+        if request.error is not None:
+            raise request.error
+        return request.added
+
+    def _add_records(self, vacancies: Iterable[Vacancy]) -> List[Vacancy]:
+        """Дописывает вакансии с новыми ссылками; возвращает добавленные"""
         data = self._load_data()
-        vacancy_dict = {
-            "title": vacancy.title,
-            "link": vacancy.link,
-            "salary": vacancy.salary,
-            "description": vacancy.description
-        }
-        if vacancy_dict not in data:
-            data.append(vacancy_dict)
+        links = {item["link"] for item in data}
+        added = []
+        for vacancy in vacancies:
+            if vacancy.link in links:
+                continue
+            links.add(vacancy.link)
+            record = self._to_dict(vacancy)
+            data.append(record)
+            if self._cached:
+                self._pending_adds[record["link"]] = record
+                self._pending_deletes.discard(record["link"])
+            if self._keyword_index is not None:
+                self._keyword_index.add(record["link"], self._record_text(record), record)
+            if self._salary_index is not None:
+                self._salary_index.add(record["link"], self._record_salary(record), record)
+            added.append(vacancy)
+        if added:
             self._save_data(data)
+        return added
 
     def get_vacancies(self, keywords: Optional[List[str]] = None, salary_range: Optional[str] = None) -> List[Vacancy]:
         data = self._load_data()
-        filtered = []
+        if not self._cached:
+            matches = self._record_filter(keywords, salary_range)
+            return [Vacancy.from_record(item) for item in data if matches(item)]
 
-        for item in data:
-            match = True
-            if keywords:
-                text = f"{item['title']} {item['description']}".lower()
-                match &= any(word.lower() in text for word in keywords)
-            if salary_range:
-                min_sal, max_sal = map(float, salary_range.split("-"))
-                match &= min_sal <= item["salary"] <= max_sal
-            if match:
-                filtered.append(Vacancy(**item))
-        return filtered
+        if keywords:
+            if self._keyword_index is None:
+                self._keyword_index = KeywordIndex()
+                for record in data:
+                    self._keyword_index.add(record["link"], self._record_text(record), record)
+            matches = self._record_filter(None, salary_range)
+            hits = self._keyword_index.search(keywords, substring=True)
+            return [self._cached_vacancy(item) for item in hits if matches(item)]
+        if salary_range:
+            if self._salary_index is None:
+                self._salary_index = SalaryIndex()
+                for record in data:
+                    self._salary_index.add(record["link"], self._record_salary(record), record)
+            min_sal, max_sal = self._parse_salary_range(salary_range)
+            data = self._salary_index.between(min_sal, max_sal, insertion_order=True)
+        return [self._cached_vacancy(item) for item in data]
+
+    def _cached_vacancy(self, record: Dict) -> Vacancy:
+        """Возвращает объект Vacancy для записи, создавая его один раз"""
+        vacancy = self._cache_objects.get(record["link"])
+        if vacancy is None:
+            vacancy = self._cache_objects[record["link"]] = Vacancy.from_record(record)
+        return vacancy
+
+    @staticmethod
+    def _record_text(record: Dict) -> str:
+        return f"{record['title']} {record['description']}"
 
     def delete_vacancy(self, vacancy: Vacancy) -> None:
+        self.delete_vacancies([vacancy.link])
+
+    def delete_vacancies(self, links: Iterable[str]) -> int:
+        """Удаляет вакансии по ссылкам за одно чтение и одну запись файла"""
+        links = set(links)
+        return self._delete_matching(lambda item: item["link"] in links)
+
+    def delete_where(
+        self, predicate: Optional[Callable[[Vacancy], bool]] = None, salary_range: Optional[str] = None
+    ) -> int:
+        return self._delete_matching(self._delete_filter(predicate, salary_range))
+
+    def _delete_matching(self, should_delete: Callable[[Dict], bool]) -> int:
+        if self._cached:
+            return self._delete_records(should_delete)
+        with self._locked():
+            return self._delete_records(should_delete)
+
+    def _delete_records(self, should_delete: Callable[[Dict], bool]) -> int:
         data = self._load_data()
-        data = [item for item in data if item["link"] != vacancy.link]
-        self._save_data(data)
+        kept: List[Dict] = []
+        deleted: List[str] = []
+        for item in data:
+            if should_delete(item):
+                deleted.append(item["link"])
+            else:
+                kept.append(item)
+        if not deleted:
+            return 0
+        if self._cached:
+            for link in deleted:
+                self._pending_adds.pop(link, None)
+                self._pending_deletes.add(link)
+                self._cache_objects.pop(link, None)
+                if self._keyword_index is not None:
+                    self._keyword_index.remove(link)
+                if self._salary_index is not None:
+                    self._salary_index.remove(link)
+        self._save_data(kept)
+        return len(deleted)
 
     # def _load_data(self) -> List[Dict]:
     #     with open(self._filename, "r", encoding="utf-8") as file:
@@ -69,16 +383,406 @@ class JSONSaver(FileHandler):
 
     def _load_data(self) -> List[Dict]:
         """Загружает данные из файла. Если файл пустой или поврежден — возвращает пустой список"""
-        try:
-            with open(self._filename, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                if not isinstance(data, list):
-                    data = []
-        except (json.JSONDecodeError, FileNotFoundError):
-            data = []
+        if self._cached and self._cache is not None and (self._dirty or self._cache_stamp == self._file_stamp()):
+            return self._cache
 
+        stamp = self._file_stamp()
+        data = self._read_file()
+        if self._cached:
+            self._cache, self._cache_stamp = data, stamp
+            self._cache_objects, self._keyword_index, self._salary_index = {}, None, None
+        return data
+
+    def _read_file(self) -> List[Dict]:
+        with self._metrics.timer("storage_load_seconds", storage="json"):
+            try:
+                with open(self._filename, "r", encoding="utf-8") as file:
+                    data = json.load(file)
+                    if not isinstance(data, list):
+                        data = []
+            except (json.JSONDecodeError, FileNotFoundError):
+                self._metrics.inc("storage_load_errors_total", storage="json")
+                data = []
+        self._record_file_size()
         return data
 
     def _save_data(self, data: List[Dict]) -> None:
-        with open(self._filename, "w", encoding="utf-8") as file:
-            json.dump(data, file, ensure_ascii=False, indent=2)
+        if self._cached:
+            self._cache = data
+            self._dirty = True
+            return
+        self._write_file(data)
+
+    def _write_file(self, data: List[Dict]) -> None:
+        """Пишет данные во временный файл и атомарно подменяет им основной: читатели не видят обрезанный файл"""
+        temp_filename = f"{self._filename}.tmp"
+        with self._metrics.timer("storage_save_seconds", storage="json"):
+            with open(temp_filename, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, indent=2)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_filename, self._filename)
+        self._record_file_size()
+
+    def _record_file_size(self) -> None:
+        if self._metrics.enabled and os.path.exists(self._filename):
+            self._metrics.set_gauge("storage_file_bytes", os.path.getsize(self._filename), storage="json")
+
+    def _file_stamp(self) -> Optional[tuple]:
+        """Отпечаток файла для проверки, не изменил ли его другой процесс"""
+        try:
+            stat = os.stat(self._filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def flush(self) -> None:
+        """Записывает накопленные в кэше изменения в файл"""
+        if not self._dirty or self._cache is None:
+            return
+        with self._locked():
+            if self._file_stamp() != self._cache_stamp:
+                self._cache = self._merge_pending(self._read_file())
+                self._cache_objects, self._keyword_index, self._salary_index = {}, None, None
+            self._write_file(self._cache)
+            self._cache_stamp = self._file_stamp()
+        self._pending_adds, self._pending_deletes = {}, set()
+        self._dirty = False
+
+    def _merge_pending(self, data: List[Dict]) -> List[Dict]:
+        """Применяет накопленные в кэше добавления и удаления к версии файла, записанной другим процессом"""
+        data = [item for item in data if item["link"] not in self._pending_deletes]
+        links = {item["link"] for item in data}
+        data.extend(record for link, record in self._pending_adds.items() if link not in links)
+        return data
+
+
+class JSONLinesSaver(FileHandler):
+    """Хранит вакансии в JSON Lines: добавление и удаление дописывают строку в конец файла.
+
+    Удаление записывается как строка-надгробие {"link": ..., "deleted": true}. Когда доля
+    мёртвых строк превышает compact_threshold, файл переписывается только живыми записями.
+    Индекс живых записей строится при открытии, поэтому в файл должен писать один процесс.
+    """
+
+    def __init__(
+        self, filename: str = "vacancies.jsonl", compact_threshold: float = 0.5, compact_min_lines: int = 1000
+    ):
+        self._filename = filename
+        self._compact_threshold = compact_threshold
+        self._compact_min_lines = compact_min_lines
+        self._live: Dict[str, int] = {}  # ссылка → номер строки с актуальной записью
+        self._line_count = 0
+        self._needs_newline = False
+        if not os.path.exists(self._filename):
+            open(self._filename, "w", encoding="utf-8").close()
+        self._build_index()
+
+    def _iter_lines(self) -> Iterator[Optional[Dict]]:
+        """Читает файл построчно; повреждённые строки (например, недописанные при сбое) и строки,
+        в которых не JSON-объект, отдаёт как None"""
+        with open(self._filename, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                yield record if isinstance(record, dict) else None
+
+    def _build_index(self) -> None:
+        """Строит индекс живых записей одним проходом по файлу"""
+        self._live = {}
+        self._line_count = 0
+        for number, record in enumerate(self._iter_lines()):
+            self._line_count = number + 1
+            if record is None or "link" not in record:
+                continue
+            if record.get("deleted"):
+                self._live.pop(record["link"], None)
+            else:
+                self._live[record["link"]] = number
+        self._needs_newline = os.path.getsize(self._filename) > 0 and not self._ends_with_newline()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self._filename, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def _append(self, records: List[Dict]) -> None:
+        """Дописывает записи в конец файла одной операцией"""
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with open(self._filename, "a", encoding="utf-8") as file:
+            if self._needs_newline:
+                file.write("\n")  # дописываем оборванную строку, номер строк не меняется
+                self._needs_newline = False
+            file.write(lines)
+        self._line_count += len(records)
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """Дописывает новые вакансии, дубли отсекаются по ссылке"""
+        records: List[Dict] = []
+        first_line = self._line_count
+        for vacancy in vacancies:
+            if vacancy.link in self._live:
+                continue
+            self._live[vacancy.link] = first_line + len(records)
+            records.append(self._to_dict(vacancy))
+        if records:
+            self._append(records)
+        return len(records)
+
+    def get_vacancies(self, keywords: Optional[List[str]] = None, salary_range: Optional[str] = None) -> List[Vacancy]:
+        filtered = []
+        matches = self._record_filter(keywords, salary_range)
+        for record in self._iter_live():
+            if matches(record):
+                filtered.append(Vacancy.from_record(record))
+        return filtered
+
+    def _iter_live(self) -> Iterator[Dict]:
+        """Отдаёт только актуальные записи: без надгробий, устаревших копий и повреждённых строк"""
+        for number, record in enumerate(self._iter_lines()):
+            if record is None or record.get("deleted"):
+                continue
+            if self._live.get(record.get("link", "")) == number:
+                yield record
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        self.delete_vacancies([vacancy.link])
+
+    def delete_vacancies(self, links: Iterable[str]) -> int:
+        """Дописывает надгробия для всех живых ссылок одной операцией"""
+        tombstones = []
+        for link in dict.fromkeys(links):
+            if self._live.pop(link, None) is not None:
+                tombstones.append({"link": link, "deleted": True})
+        if tombstones:
+            self._append(tombstones)
+            self._maybe_compact()
+        return len(tombstones)
+
+    def delete_where(
+        self, predicate: Optional[Callable[[Vacancy], bool]] = None, salary_range: Optional[str] = None
+    ) -> int:
+        should_delete = self._delete_filter(predicate, salary_range)
+        links = [record["link"] for record in self._iter_live() if should_delete(record)]
+        return self.delete_vacancies(links)
+
+    def _maybe_compact(self) -> None:
+        """Запускает уплотнение, если мёртвых строк стало слишком много"""
+        if self._line_count < self._compact_min_lines:
+            return
+        dead = self._line_count - len(self._live)
+        if dead / self._line_count > self._compact_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """Атомарно переписывает файл, оставляя только живые записи"""
+        temp_filename = f"{self._filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            for record in self._iter_live():
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, self._filename)
+        self._build_index()
+
+
+class SQLiteSaver(FileHandler):
+    """Хранит вакансии в SQLite: индекс по зарплате и полнотекстовый индекс FTS5 по названию и описанию.
+
+    Ключевые слова ищутся как префиксы слов (python найдёт python3, но не cpython),
+    регистр не учитывается, в том числе для кириллицы. Зарплата хранится с валютой, а диапазон
+    зарплат проверяется по индексированной колонке normalized_salary — сумме в базовой валюте.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vacancies (
+            id INTEGER PRIMARY KEY,
+            link TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            salary REAL NOT NULL,
+            description TEXT NOT NULL,
+            salary_from REAL,
+            salary_to REAL,
+            currency TEXT NOT NULL DEFAULT 'RUR',
+            gross INTEGER,
+            normalized_salary REAL NOT NULL DEFAULT 0
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5(
+            title, description, content='vacancies', content_rowid='id', tokenize='unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+            INSERT INTO vacancies_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END;
+        CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+            INSERT INTO vacancies_fts(vacancies_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END;
+    """
+
+    # Колонки, которых нет в базах, созданных до хранения валюты; добавляются при открытии
+    _SALARY_COLUMNS = (
+        ("salary_from", "REAL"),
+        ("salary_to", "REAL"),
+        ("currency", "TEXT NOT NULL DEFAULT 'RUR'"),
+        ("gross", "INTEGER"),
+        ("normalized_salary", "REAL NOT NULL DEFAULT 0"),
+    )
+
+    _INDEXES = """
+        DROP INDEX IF EXISTS idx_vacancies_salary;
+        CREATE INDEX IF NOT EXISTS idx_vacancies_normalized_salary ON vacancies(normalized_salary);
+    """
+
+    def __init__(self, filename: str = "vacancies.db"):
+        self._filename = filename
+        self._connection = sqlite3.connect(self._filename)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self._SCHEMA)
+        self._migrate()
+        self._connection.executescript(self._INDEXES)
+
+    def _migrate(self) -> None:
+        """Добавляет колонки валюты в старую базу; старые суммы, как и в JSONSaver, считаются рублями"""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(vacancies)")}
+        missing = [(name, declaration) for name, declaration in self._SALARY_COLUMNS if name not in columns]
+        if not missing:
+            return
+        with self._connection:
+            for name, declaration in missing:
+                self._connection.execute(f"ALTER TABLE vacancies ADD COLUMN {name} {declaration}")
+            self._connection.execute(
+                "UPDATE vacancies SET salary_from = NULLIF(salary, 0), normalized_salary = salary"
+            )
+
+    def __enter__(self) -> "SQLiteSaver":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Закрывает соединение с базой"""
+        self._connection.close()
+
+    def add_vacancy(self, vacancy: Vacancy) -> None:
+        self.add_vacancies([vacancy])
+
+    def add_vacancies(self, vacancies: Iterable[Vacancy]) -> int:
+        """Добавляет вакансии одной транзакцией, дубли по ссылке пропускаются"""
+        return self._insert_records(self._to_dict(vacancy) for vacancy in vacancies)
+
+    @classmethod
+    def _row(cls, record: Dict) -> Dict:
+        """Параметры строки таблицы из записи формата _to_dict; у записей без salary_info валюта — рубли"""
+        salary_info = record.get("salary_info")
+        if salary_info is None:
+            salary_info = Salary.from_raw(record["salary"]).to_dict()
+        gross = salary_info.get("gross")
+        return {
+            "link": record["link"],
+            "title": record["title"],
+            "salary": record["salary"],
+            "description": record["description"],
+            "salary_from": salary_info.get("from"),
+            "salary_to": salary_info.get("to"),
+            "currency": salary_info.get("currency") or "RUR",
+            "gross": None if gross is None else int(gross),
+            "normalized_salary": cls._record_salary(record),
+        }
+
+    def _insert_records(self, records: Iterable[Dict]) -> int:
+        """Вставляет записи формата _to_dict; возвращает число вставленных (дубли не считаются)"""
+        rows = [self._row(record) for record in records]  # до начала транзакции, чтобы не держать запись
+        with self._connection:
+            cursor = self._connection.executemany(
+                "INSERT OR IGNORE INTO vacancies "
+                "(link, title, salary, description, salary_from, salary_to, currency, gross, normalized_salary) "
+                "VALUES (:link, :title, :salary, :description, "
+                ":salary_from, :salary_to, :currency, :gross, :normalized_salary)",
+                rows,
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _fts_query(keywords: List[str]) -> str:
+        """Собирает запрос FTS5: любое из слов как префикс"""
+        terms = []
+        for word in keywords:
+            word = word.strip().replace('"', '""')
+            if word:
+                terms.append(f'"{word}"*')
+        return " OR ".join(terms)
+
+    def get_vacancies(self, keywords: Optional[List[str]] = None, salary_range: Optional[str] = None) -> List[Vacancy]:
+        conditions = []
+        params: List = []
+        fts_query = self._fts_query(keywords) if keywords else ""
+        if fts_query:
+            conditions.append("id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)")
+            params.append(fts_query)
+        if salary_range:
+            min_sal, max_sal = self._parse_salary_range(salary_range)
+            conditions.append("normalized_salary BETWEEN ? AND ?")
+            params.extend([min_sal, max_sal])
+
+        query = (
+            "SELECT title, link, salary, description, salary_from, salary_to, currency, gross FROM vacancies"
+        )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id"
+        return [self._vacancy(row) for row in self._connection.execute(query, params)]
+
+    @staticmethod
+    def _vacancy(row: Tuple) -> Vacancy:
+        title, link, salary, description, salary_from, salary_to, currency, gross = row
+        gross = None if gross is None else bool(gross)
+        salary_info = Salary.from_stored({"from": salary_from, "to": salary_to, "currency": currency, "gross": gross})
+        return Vacancy.from_trusted(title, link, salary, description, salary_info)
+
+    def delete_vacancy(self, vacancy: Vacancy) -> None:
+        self.delete_vacancies([vacancy.link])
+
+    def delete_vacancies(self, links: Iterable[str]) -> int:
+        """Удаляет вакансии по ссылкам одной транзакцией"""
+        with self._connection:
+            cursor = self._connection.executemany("DELETE FROM vacancies WHERE link = ?", ((link,) for link in links))
+        return cursor.rowcount
+
+    def delete_where(
+        self, predicate: Optional[Callable[[Vacancy], bool]] = None, salary_range: Optional[str] = None
+    ) -> int:
+        """Условие по зарплате выполняется в SQL по индексу, predicate — только для отобранных строк"""
+        if predicate is None:
+            if not salary_range:
+                raise ValueError("Не задано ни одного условия удаления")
+            min_sal, max_sal = self._parse_salary_range(salary_range)
+            with self._connection:
+                cursor = self._connection.execute(
+                    "DELETE FROM vacancies WHERE normalized_salary BETWEEN ? AND ?", (min_sal, max_sal)
+                )
+            return cursor.rowcount
+        return self.delete_vacancies(v.link for v in self.get_vacancies(salary_range=salary_range) if predicate(v))
+
+    def import_json(self, filename: str) -> int:
+        """Переносит вакансии из файла JSONSaver; возвращает число новых записей"""
+        if not os.path.exists(filename):
+            return 0
+        records = JSONSaver(filename)._load_data()
+        return self._insert_records(
+            {
+                "link": item["link"],
+                "title": item["title"],
+                "salary": float(item.get("salary") or 0.0),
+                "description": item.get("description", ""),
+                "salary_info": item.get("salary_info"),
+            }
+            for item in records
+            if item.get("link") and item.get("title")
+        )
@@ -0,0 +1,115 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedResponse:
+    """Сохранённый ответ API и данные для его условной перепроверки"""
+
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """Дисковый кэш ответов API в SQLite с TTL и вытеснением давно не использованных записей.
+
+    Пока запись моложе ttl, она отдаётся без запроса. Устаревшая запись перепроверяется
+    условным запросом (If-None-Match / If-Modified-Since): на ответ 304 тело берётся из кэша.
+    Когда суммарный размер тел превышает max_bytes, удаляются записи, к которым дольше всего
+    не обращались.
+    """
+
+    def __init__(self, filename: str = "hh_cache.db", ttl: float = 900, max_bytes: int = 50 * 1024 * 1024):
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Dict) -> str:
+        """Ключ запроса: параметры отсортированы, значения приведены к строкам, пробелы в тексте схлопнуты"""
+        normalized = {}
+        for name, value in params.items():
+            value = str(value)
+            if name == "text":
+                value = " ".join(value.split())
+            normalized[name] = value
+        return url + "?" + json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Проверяет, что запись ещё не устарела по TTL"""
+        return time.time() - entry.stored_at < self._ttl
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Возвращает запись и отмечает обращение к ней"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._connection.commit()
+        return CachedResponse(*row)
+
+    def put(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Сохраняет ответ и вытесняет старые записи сверх лимита"""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, stored_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def touch(self, key: str) -> None:
+        """Продлевает жизнь записи после ответа 304"""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?", (now, now, key)
+            )
+            self._connection.commit()
+
+    def _evict(self) -> None:
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        """Удаляет все записи"""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,206 @@
+import re
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from src.vacancies import Vacancy
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class KeywordIndex:
+    """Инвертированный индекс по словам: слово → множество ключей документов.
+
+    Строится один раз по набору данных и обновляется при добавлении и удалении документов.
+    Запросы ANY/ALL выполняются операциями над множествами, а не проходом по всем текстам.
+    В режиме substring поиск совпадает с проверкой word.lower() in text.lower(): индекс по словам
+    отбирает кандидатов, а кандидаты сверяются с исходным текстом в нижнем регистре.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[int]] = {}
+        self._doc_ids: Dict[Hashable, int] = {}
+        self._doc_tokens: Dict[int, Set[str]] = {}
+        self._texts: Dict[int, str] = {}
+        self._values: Dict[int, Any] = {}
+        self._next_id = 0
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    @staticmethod
+    def tokenize(text: str) -> Set[str]:
+        """Разбивает текст на слова в нижнем регистре; теги подсветки hh.ru отбрасываются, ё приводится к е"""
+        text = _TAG_RE.sub(" ", text).lower().replace("ё", "е")
+        return set(_TOKEN_RE.findall(text))
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "KeywordIndex":
+        """Строит индекс по названию и описанию вакансий, ключ — ссылка"""
+        index = cls()
+        for vacancy in vacancies:
+            index.add(vacancy.link, f"{vacancy.title} {vacancy.description}", vacancy)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._doc_ids
+
+    def add(self, key: Hashable, text: str, value: Any = None) -> None:
+        """Добавляет документ; если ключ уже есть, документ заменяется"""
+        if key in self._doc_ids:
+            self.remove(key)
+        doc_id = self._next_id
+        self._next_id += 1
+        tokens = self.tokenize(text)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                self._postings[token] = postings = set()
+                self._vocabulary_dirty = True
+            postings.add(doc_id)
+        self._doc_ids[key] = doc_id
+        self._doc_tokens[doc_id] = tokens
+        self._texts[doc_id] = text.lower()
+        self._values[doc_id] = key if value is None else value
+
+    def remove(self, key: Hashable) -> None:
+        """Удаляет документ из индекса, если он там есть"""
+        doc_id = self._doc_ids.pop(key, None)
+        if doc_id is None:
+            return
+        for token in self._doc_tokens.pop(doc_id):
+            postings = self._postings[token]
+            postings.discard(doc_id)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary_dirty = True
+        del self._values[doc_id]
+        del self._texts[doc_id]
+
+    def _expand(self, token: str, prefix: bool, substring: bool = False) -> Set[int]:
+        """Документы, содержащие слово (любое слово с таким началом при prefix=True, с такой частью при substring)"""
+        if substring:
+            result = set()
+            for word, postings in self._postings.items():
+                if token in word:
+                    result |= postings
+            return result
+        if not prefix:
+            return self._postings.get(token, set())
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        result = set()
+        for position in range(bisect_left(self._vocabulary, token), len(self._vocabulary)):
+            word = self._vocabulary[position]
+            if not word.startswith(token):
+                break
+            result |= self._postings[word]
+        return result
+
+    def _match_keyword(self, keyword: str, prefix: bool, substring: bool = False) -> Set[int]:
+        """Документы, содержащие все слова ключевой фразы (при substring — саму фразу как подстроку)"""
+        tokens = self.tokenize(keyword)
+        if not tokens:
+            candidates = set(self._texts) if substring else set()
+        else:
+            sets = sorted((self._expand(token, prefix, substring) for token in tokens), key=len)
+            candidates = set(sets[0]).intersection(*sets[1:])
+        if not substring:
+            return candidates
+        needle = keyword.lower()
+        return {doc_id for doc_id in candidates if needle in self._texts[doc_id]}
+
+    def search(
+        self, keywords: Iterable[str], match_all: bool = False, prefix: bool = False, substring: bool = False
+    ) -> List[Any]:
+        """Возвращает документы, где встречается любое (или каждое при match_all) из слов, в порядке добавления"""
+        matches = [self._match_keyword(keyword, prefix, substring) for keyword in keywords]
+        if not matches:
+            return []
+        if match_all:
+            matches.sort(key=len)
+            doc_ids = set(matches[0]).intersection(*matches[1:])
+        else:
+            doc_ids = set().union(*matches)
+        return [self._values[doc_id] for doc_id in sorted(doc_ids)]
+
+
+class SalaryIndex:
+    """Отсортированный по зарплате индекс: диапазоны и топ-N за O(log n) плюс размер ответа.
+
+    Ключ сортировки — (зарплата, -порядковый номер), поэтому при равной зарплате
+    в топе первой идёт вакансия, добавленная раньше, как при стабильной сортировке.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[float, int]] = []
+        self._values: List[Any] = []
+        self._positions: Dict[Hashable, Tuple[float, int]] = {}
+        self._next_seq = 0
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "SalaryIndex":
+        """Строит индекс одной сортировкой по зарплате в базовой валюте; ключ — ссылка"""
+        index = cls()
+        entries = []
+        for vacancy in vacancies:
+            if vacancy.link in index._positions:
+                continue
+            key = (vacancy.normalized_salary, -index._next_seq)
+            index._next_seq += 1
+            index._positions[vacancy.link] = key
+            entries.append((key, vacancy))
+        entries.sort(key=lambda entry: entry[0])
+        index._keys = [key for key, _ in entries]
+        index._values = [vacancy for _, vacancy in entries]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def add(self, key: Hashable, salary: float, value: Any = None) -> None:
+        """Добавляет запись; если ключ уже есть, запись заменяется"""
+        if key in self._positions:
+            self.remove(key)
+        sort_key = (salary, -self._next_seq)
+        self._next_seq += 1
+        position = bisect_left(self._keys, sort_key)
+        self._keys.insert(position, sort_key)
+        self._values.insert(position, key if value is None else value)
+        self._positions[key] = sort_key
+
+    def remove(self, key: Hashable) -> None:
+        """Удаляет запись, если она есть"""
+        sort_key = self._positions.pop(key, None)
+        if sort_key is None:
+            return
+        position = bisect_left(self._keys, sort_key)
+        del self._keys[position]
+        del self._values[position]
+
+    def _bounds(self, min_salary: Optional[float], max_salary: Optional[float]) -> Tuple[int, int]:
+        """Границы среза для зарплат в диапазоне [min_salary, max_salary]"""
+        low = 0 if min_salary is None else bisect_left(self._keys, (min_salary, -self._next_seq))
+        high = len(self._keys) if max_salary is None else bisect_right(self._keys, (max_salary, 0))
+        return low, max(low, high)
+
+    def between(
+        self, min_salary: Optional[float] = None, max_salary: Optional[float] = None, insertion_order: bool = False
+    ) -> List[Any]:
+        """Записи с зарплатой в диапазоне: по возрастанию зарплаты или в порядке добавления"""
+        low, high = self._bounds(min_salary, max_salary)
+        if not insertion_order:
+            return self._values[low:high]
+        positions = sorted(range(low, high), key=lambda position: -self._keys[position][1])
+        return [self._values[position] for position in positions]
+
+    def top(self, n: int, min_salary: Optional[float] = None, max_salary: Optional[float] = None) -> List[Any]:
+        """N записей с наибольшей зарплатой в диапазоне, по убыванию"""
+        low, high = self._bounds(min_salary, max_salary)
+        return self._values[max(low, high - n):high][::-1]
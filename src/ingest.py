@@ -0,0 +1,150 @@
+"""Пакетная загрузка больших выгрузок hh.ru: разбор и проверка вакансий в пуле процессов.
+
+    python -m src.ingest dumps/ --workers 8 --chunk-size 5000 --output vacancies.jsonl
+"""
+
+import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, TypeVar
+
+from src.filehandler import JSONLinesSaver
+from src.salary import Salary
+from src.vacancies import Vacancy
+
+T = TypeVar("T")
+
+
+class VacancyRecord(NamedTuple):
+    """Компактная проверенная запись вакансии; дёшево передаётся между процессами"""
+
+    title: str
+    link: str
+    salary: float
+    description: str
+    salary_info: Optional[Dict] = None
+
+    def to_vacancy(self) -> Vacancy:
+        salary_info = Salary.from_stored(self.salary_info) if self.salary_info is not None else None
+        return Vacancy.from_trusted(self.title, self.link, self.salary, self.description, salary_info)
+
+
+def iter_dump_files(paths: Iterable[str]) -> Iterator[str]:
+    """Отдаёт пути к .json файлам: файлы как есть, каталоги — рекурсивно в алфавитном порядке"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(".json"):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def load_dump(path: str) -> List[Dict]:
+    """Читает выгрузку: ответ API с ключом items или просто список вакансий"""
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    if isinstance(data, dict):
+        data = data.get("items", [])
+    return data if isinstance(data, list) else []
+
+
+def parse_items(items: Iterable[Dict]) -> List[VacancyRecord]:
+    """Разбирает и проверяет вакансии; некорректные пропускаются, как в Vacancy.cast_to_object_list"""
+    return [
+        VacancyRecord(v.title, v.link, v.salary, v.description, v.salary_info.to_dict())
+        for v in Vacancy.iter_from_raw(items)
+    ]
+
+
+def parse_dump(path: str) -> List[VacancyRecord]:
+    """Разбирает один файл выгрузки; выполняется в процессе-обработчике"""
+    try:
+        return parse_items(load_dump(path))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        print(f"Ошибка при чтении {path}: {e}")
+        return []
+
+
+def parse_dumps(paths: List[str]) -> List[VacancyRecord]:
+    """Разбирает пачку файлов выгрузки в одном процессе-обработчике"""
+    return [record for path in paths for record in parse_dump(path)]
+
+
+def _chunks(items: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _map_bounded(
+    executor: Executor, func: Callable[[T], List[VacancyRecord]], tasks: Iterable[T], window: int
+) -> Iterator[List[VacancyRecord]]:
+    """Как executor.map, но задачи берутся из tasks лениво и в работе не больше window за раз.
+
+    Executor.map сразу отправляет все задачи: вход читается целиком, а готовые результаты
+    копятся в родительском процессе, пока их не заберёт писатель.
+    """
+    pending: Deque[Future] = deque()
+    try:
+        for task in tasks:
+            pending.append(executor.submit(func, task))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _window(workers: Optional[int]) -> int:
+    return 2 * (workers or os.cpu_count() or 1)
+
+
+def ingest_dumps(
+    paths: Iterable[str], workers: Optional[int] = None, chunk_size: int = 1
+) -> Iterator[VacancyRecord]:
+    """Разбирает файлы выгрузок в пуле процессов; chunk_size — сколько файлов отдаётся процессу за раз.
+
+    Записи отдаются в порядке файлов по мере готовности; в работе не больше 2 × workers пачек.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = _chunks(iter_dump_files(paths), chunk_size)
+        for records in _map_bounded(executor, parse_dumps, tasks, _window(workers)):
+            yield from records
+
+
+def ingest_items(
+    items: Iterable[Dict], workers: Optional[int] = None, chunk_size: int = 5000
+) -> Iterator[VacancyRecord]:
+    """Разбирает уже загруженные вакансии в пуле процессов пачками по chunk_size, сохраняя порядок.
+
+    Вход читается лениво: в работе не больше 2 × workers пачек.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for records in _map_bounded(executor, parse_items, _chunks(items, chunk_size), _window(workers)):
+            yield from records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="+", help="файлы или каталоги с выгрузками hh.ru")
+    parser.add_argument("--workers", type=int, default=None, help="число процессов (по умолчанию — число ядер)")
+    parser.add_argument("--chunk-size", type=int, default=1, help="сколько файлов отдавать процессу за раз")
+    parser.add_argument("--output", default="vacancies.jsonl", help="файл JSON Lines для результата")
+    args = parser.parse_args()
+
+    saver = JSONLinesSaver(args.output)
+    records = ingest_dumps(args.paths, args.workers, args.chunk_size)
+    total = sum(1 for _ in saver.add_stream(record.to_vacancy() for record in records))
+    print(f"Обработано вакансий: {total}")
+
+
+if __name__ == "__main__":
+    main()
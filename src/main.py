@@ -1,12 +1,22 @@
-from typing import List
+import argparse
+import cProfile
+import heapq
+import logging
+from typing import Iterable, List, Optional
 
 from src.api_interactions import HeadHunterAPI
 from src.filehandler import JSONSaver
+from src.indexes import KeywordIndex, SalaryIndex
+from src.metrics import LogSink, Metrics, MetricsSink, PrometheusFileSink
 from src.vacancies import Vacancy
 
 
-def filter_vacancies(vacancies: List[Vacancy], keywords: List[str]) -> List[Vacancy]:
-    """Фильтрует вакансии по ключевым словам"""
+def filter_vacancies(
+    vacancies: Iterable[Vacancy], keywords: List[str], index: Optional[KeywordIndex] = None
+) -> List[Vacancy]:
+    """Фильтрует вакансии по ключевым словам; если передан индекс по этим вакансиям, ищет по нему"""
+    if index is not None:
+        return index.search(keywords, substring=True)
     return [
         v for v in vacancies
         if any(word.lower() in v.title.lower() or word.lower() in v.description.lower() for word in keywords)
@@ -23,14 +33,18 @@ def filter_vacancies(vacancies: List[Vacancy], keywords: List[str]) -> List[Vaca
 #     except ValueError:
 #         return []
 
-def get_vacancies_by_salary(vacancies: List[Vacancy], min_salary: str) -> List[Vacancy]:
-    """Фильтрует вакансии, где зарплата >= указанной суммы"""
+def get_vacancies_by_salary(
+    vacancies: List[Vacancy], min_salary: str, index: Optional[SalaryIndex] = None
+) -> List[Vacancy]:
+    """Фильтрует вакансии, где зарплата >= указанной суммы; если передан индекс по этим вакансиям, ищет по нему"""
     if not min_salary:
         return vacancies  # Если порог не задан, возвращаем всё
 
     try:
         threshold = float(min_salary.strip())
-        return [v for v in vacancies if v.salary >= threshold and v.salary > 0]
+        if index is not None:
+            return [v for v in index.between(threshold, insertion_order=True) if v.normalized_salary > 0]
+        return [v for v in vacancies if v.normalized_salary >= threshold and v.normalized_salary > 0]
     except ValueError:
         print("Неверный формат зарплаты. Используйте число, например: 100000")
         return []
@@ -41,8 +55,8 @@ def get_vacancies_by_salary(vacancies: List[Vacancy], min_salary: str) -> List[V
 #     return sorted(vacancies, key=lambda v: v.salary, reverse=True)
 
 def sort_vacancies(vacancies: List[Vacancy]) -> List[Vacancy]:
-    """Сортирует вакансии по убыванию зарплаты"""
-    return sorted(vacancies, key=lambda v: v.salary, reverse=True)
+    """Сортирует вакансии по убыванию зарплаты в базовой валюте"""
+    return sorted(vacancies, key=lambda v: v.normalized_salary, reverse=True)
 
 
 def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
@@ -50,6 +64,11 @@ def get_top_vacancies(vacancies: List[Vacancy], top_n: int) -> List[Vacancy]:
     return vacancies[:top_n]
 
 
+def get_top_vacancies_by_salary(vacancies: Iterable[Vacancy], top_n: int) -> List[Vacancy]:
+    """Возвращает N вакансий с наибольшей зарплатой без полной сортировки (куча, O(n log N))"""
+    return heapq.nlargest(top_n, vacancies, key=lambda v: v.normalized_salary)
+
+
 def print_vacancies(vacancies: List[Vacancy]):
     """Выводит вакансии пользователю"""
     if not vacancies:
@@ -59,35 +78,65 @@ def print_vacancies(vacancies: List[Vacancy]):
     for idx, vacancy in enumerate(vacancies, 1):
         print(f"{idx}. {vacancy.title}")
         print(f"Ссылка: {vacancy.link}")
-        print(f"Зарплата: {vacancy.salary or 'Не указана'} руб.")
+        print(f"Зарплата: {vacancy.salary_info}")
         print(f"Описание: {vacancy.description[:100]}...\n")
 
 
-def user_interaction():
-    """Функция взаимодействия с пользователем"""
-    hh_api = HeadHunterAPI()
-    hh_api.connect()
-
-    search_query = input("Введите поисковый запрос: ")
-    hh_vacancies = hh_api.get_vacancies(search_query)
-
-    vacancies_list = Vacancy.cast_to_object_list(hh_vacancies)
-    json_saver = JSONSaver("vacancies.json")
-    for vacancy in vacancies_list:
-        json_saver.add_vacancy(vacancy)
-
-    top_n = int(input("Введите количество вакансий для вывода в топ N: "))
-    filter_words = input("Введите ключевые слова для фильтрации: ").split()
-    salary_range = input("Введите диапазон зарплат (пример: 100000-150000): ")
-
-    filtered = filter_vacancies(vacancies_list, filter_words)
-    ranged = get_vacancies_by_salary(filtered, salary_range)
-    sorted_vacancies = sort_vacancies(ranged)
-    top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
-
-    print_vacancies(top_vacancies)
-
+def user_interaction(metrics: Optional[Metrics] = None):
+    """Функция взаимодействия с пользователем; с metrics записывает время стадий, HTTP и работы с файлом"""
+    metrics = metrics if metrics is not None else Metrics()
+    # Одна keep-alive сессия на проверку подключения и загрузку всех страниц
+    with HeadHunterAPI(metrics=metrics) as hh_api:
+        hh_api.connect()
+
+        search_query = input("Введите поисковый запрос: ")
+        top_n = int(input("Введите количество вакансий для вывода в топ N: "))
+        filter_words = input("Введите ключевые слова для фильтрации: ").split()
+        salary_range = input("Введите диапазон зарплат (пример: 100000-150000): ")
+
+        # Страницы API → объекты Vacancy → сохранение пачками → фильтрация, без промежуточных списков
+        json_saver = JSONSaver("vacancies.json", metrics=metrics)
+        raw_stream = metrics.timed_stage("fetch", hh_api.iter_vacancies(search_query))
+        parsed_stream = metrics.timed_stage("parse", Vacancy.iter_from_raw(raw_stream))
+        vacancies_stream = metrics.timed_stage("save", json_saver.add_stream(parsed_stream))
+
+        with metrics.timer("pipeline_stage_seconds", stage="filter"):
+            filtered = filter_vacancies(vacancies_stream, filter_words)
+        with metrics.timer("pipeline_stage_seconds", stage="salary"):
+            ranged = get_vacancies_by_salary(filtered, salary_range)
+        with metrics.timer("pipeline_stage_seconds", stage="top"):
+            top_vacancies = get_top_vacancies_by_salary(ranged, top_n)
+
+        print_vacancies(top_vacancies)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Поиск вакансий на hh.ru")
+    parser.add_argument("--metrics-file", help="записать метрики в файл в текстовом формате Prometheus")
+    parser.add_argument("--log-metrics", action="store_true", help="выводить каждое измерение в журнал")
+    parser.add_argument("--profile", metavar="FILE", help="сохранить профиль cProfile (смотреть через pstats)")
+    args = parser.parse_args(argv)
+
+    sinks: List[MetricsSink] = []
+    if args.metrics_file:
+        sinks.append(PrometheusFileSink(args.metrics_file))
+    if args.log_metrics:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+        sinks.append(LogSink())
+    metrics = Metrics(sinks)
+
+    profiler = cProfile.Profile() if args.profile else None
+    try:
+        if profiler is not None:
+            profiler.runcall(user_interaction, metrics)
+        else:
+            user_interaction(metrics)
+    finally:
+        metrics.flush()
+        if profiler is not None:
+            profiler.dump_stats(args.profile)
+            print(f"Профиль сохранён в {args.profile}: python -m pstats {args.profile}")
 
 
 if __name__ == "__main__":
-    user_interaction()
+    main()
@@ -0,0 +1,223 @@
+"""Необязательные метрики: счётчики, длительности и значения с подключаемыми приёмниками.
+
+Metrics() без приёмников ничего не записывает и почти ничего не стоит, поэтому клиенты API
+и хранилища держат его по умолчанию, а включение метрик — это передача Metrics со списком sinks.
+"""
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsSink(ABC):
+    @abstractmethod
+    def record(self, kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        """Принимает одно измерение: kind — counter, summary или gauge"""
+        pass
+
+    def flush(self) -> None:
+        """Выгружает накопленное; по умолчанию ничего не делает"""
+        pass
+
+
+@dataclass
+class Summary:
+    """Сводка наблюдений: число, сумма, минимум и максимум"""
+
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+class InMemorySink(MetricsSink):
+    """Агрегирует измерения в памяти; удобен для тестов и отчётов в конце работы"""
+
+    def __init__(self) -> None:
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.gauges: Dict[Tuple[str, Labels], float] = {}
+        self.summaries: Dict[Tuple[str, Labels], Summary] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            if kind == "counter":
+                self.counters[key] = self.counters.get(key, 0.0) + value
+            elif kind == "gauge":
+                self.gauges[key] = value
+            else:
+                self.summaries.setdefault(key, Summary()).add(value)
+
+    def counter(self, name: str, **labels: object) -> float:
+        return self.counters.get((name, _labels_key(labels)), 0.0)
+
+    def summary(self, name: str, **labels: object) -> Summary:
+        return self.summaries.get((name, _labels_key(labels)), Summary())
+
+    def gauge(self, name: str, **labels: object) -> float:
+        return self.gauges.get((name, _labels_key(labels)), 0.0)
+
+
+class LogSink(MetricsSink):
+    """Пишет каждое измерение в журнал logging"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self._logger = logger or logging.getLogger("job_search.metrics")
+        self._level = level
+
+    def record(self, kind: str, name: str, value: float, labels: Dict[str, str]) -> None:
+        self._logger.log(self._level, "%s %s%s %.6g", kind, name, _format_labels(labels), value)
+
+
+class PrometheusFileSink(InMemorySink):
+    """Копит измерения и по flush() атомарно пишет их в текстовом формате Prometheus
+    (для textfile collector у node_exporter). Сводки выгружаются как summary: _count и _sum."""
+
+    def __init__(self, filename: str):
+        super().__init__()
+        self._filename = filename
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            for kind, values in (("counter", self.counters), ("gauge", self.gauges)):
+                for name in sorted({name for name, _ in values}):
+                    lines.append(f"# TYPE {name} {kind}")
+                    for (metric, labels), value in sorted(values.items()):
+                        if metric == name:
+                            lines.append(f"{name}{_format_labels(dict(labels))} {value:g}")
+            for name in sorted({name for name, _ in self.summaries}):
+                lines.append(f"# TYPE {name} summary")
+                for (metric, labels), summary in sorted(self.summaries.items(), key=lambda item: item[0]):
+                    if metric == name:
+                        lines.append(f"{name}_count{_format_labels(dict(labels))} {summary.count}")
+                        lines.append(f"{name}_sum{_format_labels(dict(labels))} {summary.total:g}")
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        temp_filename = f"{self._filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            file.write(self.render())
+        os.replace(temp_filename, self._filename)
+
+
+def _labels_key(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in sorted(labels.items()):
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Metrics:
+    """Точка записи метрик; измерения рассылаются во все приёмники.
+
+    timer() и timed_stage() считают собственное время: время вложенных таймеров и стадий,
+    из которых стадия берёт элементы, вычитается, поэтому стадии конвейера на генераторах
+    не учитывают друг друга дважды.
+    """
+
+    def __init__(self, sinks: Iterable[MetricsSink] = ()):
+        self._sinks = list(sinks)
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._sinks)
+
+    def _record(self, kind: str, name: str, value: float, labels: Dict[str, object]) -> None:
+        str_labels = {key: str(label) for key, label in labels.items()}
+        for sink in self._sinks:
+            sink.record(kind, name, value, str_labels)
+
+    def inc(self, name: str, value: float = 1.0, **labels: object) -> None:
+        if self._sinks:
+            self._record("counter", name, value, labels)
+
+    def observe(self, name: str, value: float, **labels: object) -> None:
+        if self._sinks:
+            self._record("summary", name, value, labels)
+
+    def set_gauge(self, name: str, value: float, **labels: object) -> None:
+        if self._sinks:
+            self._record("gauge", name, value, labels)
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _measure_start(self) -> float:
+        self._stack().append(0.0)  # время вложенных измерений
+        return time.perf_counter()
+
+    def _measure_end(self, start: float) -> float:
+        elapsed = time.perf_counter() - start
+        stack = self._stack()
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        return elapsed - nested
+
+    @contextmanager
+    def timer(self, name: str, **labels: object) -> Iterator[None]:
+        """Записывает собственное время выполнения блока в сводку name"""
+        if not self._sinks:
+            yield
+            return
+        start = self._measure_start()
+        try:
+            yield
+        finally:
+            self.observe(name, self._measure_end(start), **labels)
+
+    def timed_stage(self, stage: str, iterable: Iterable[T]) -> Iterable[T]:
+        """Оборачивает стадию конвейера: время, проведённое в ней, пишется в pipeline_stage_seconds"""
+        if not self._sinks:
+            return iterable
+        return self._timed_stage(stage, iterable)
+
+    def _timed_stage(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        iterator = iter(iterable)
+        own_time = 0.0
+        items = 0
+        try:
+            while True:
+                start = self._measure_start()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    own_time += self._measure_end(start)
+                items += 1
+                yield item
+        finally:
+            self.observe("pipeline_stage_seconds", own_time, stage=stage)
+            self.inc("pipeline_stage_items_total", items, stage=stage)
+
+    def flush(self) -> None:
+        for sink in self._sinks:
+            sink.flush()
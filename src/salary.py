@@ -0,0 +1,182 @@
+import json
+import os
+import re
+import sys
+from typing import Dict, Optional, Union
+
+DEFAULT_RATES_FILE = os.path.join(os.path.dirname(__file__), "fx_rates.json")
+
+# Обозначения валют в текстовых зарплатах и альтернативные коды
+_CURRENCY_ALIASES = {
+    "RUB": "RUR",
+    "РУБ": "RUR",
+    "₽": "RUR",
+    "$": "USD",
+    "€": "EUR",
+    "₸": "KZT",
+    "ТЕНГЕ": "KZT",
+}
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)?")
+
+
+class ExchangeRates:
+    """Таблица курсов к базовой валюте: сколько единиц базовой валюты стоит единица валюты.
+
+    Курсы читаются из локального JSON-файла вида {"base": "RUR", "rates": {"USD": 90.0}},
+    коэффициент для каждой валюты (с учётом синонимов вроде RUB) вычисляется один раз.
+    """
+
+    _default: Optional["ExchangeRates"] = None
+
+    def __init__(self, rates: Dict[str, float], base: str = "RUR"):
+        self.base = normalize_currency(base)
+        self._rates = {normalize_currency(code): float(rate) for code, rate in rates.items()}
+        self._rates[self.base] = 1.0
+        self._factors: Dict[str, Optional[float]] = {}
+
+    @classmethod
+    def from_file(cls, filename: str) -> "ExchangeRates":
+        with open(filename, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data.get("rates", {}), data.get("base", "RUR"))
+
+    @classmethod
+    def default(cls) -> "ExchangeRates":
+        """Таблица из fx_rates.json рядом с модулем; загружается один раз на процесс"""
+        if cls._default is None:
+            cls._default = cls.from_file(DEFAULT_RATES_FILE)
+        return cls._default
+
+    def factor(self, currency: Optional[str]) -> Optional[float]:
+        """Множитель перевода в базовую валюту; None, если курс неизвестен"""
+        key = currency or self.base
+        if key not in self._factors:
+            self._factors[key] = self._rates.get(normalize_currency(key))
+        return self._factors[key]
+
+    def convert(self, amount: float, currency: Optional[str]) -> float:
+        """Переводит сумму в базовую валюту; при неизвестном курсе возвращает 0, чтобы не искажать рейтинг"""
+        factor = self.factor(currency)
+        return amount * factor if factor is not None else 0.0
+
+
+def currency_label(currency: str) -> str:
+    """Обозначение валюты для вывода: «руб.» для рублей, для остальных — код hh.ru"""
+    code = normalize_currency(currency) if currency else "RUR"
+    return "руб." if code == "RUR" else code
+
+
+def normalize_currency(currency: str) -> str:
+    """Приводит код или обозначение валюты к коду hh.ru (RUR, USD, EUR, ...)"""
+    code = currency.strip().upper()
+    return _CURRENCY_ALIASES.get(code, code)
+
+
+class Salary:
+    """Зарплата с вилкой, валютой и признаком «до вычета налогов»"""
+
+    __slots__ = ("salary_from", "salary_to", "currency", "gross")
+
+    def __init__(
+        self,
+        salary_from: Optional[float] = None,
+        salary_to: Optional[float] = None,
+        currency: str = "RUR",
+        gross: Optional[bool] = None,
+    ):
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.currency = sys.intern(normalize_currency(currency)) if currency else "RUR"
+        self.gross = gross
+
+    @classmethod
+    def from_stored(cls, data: Dict) -> "Salary":
+        """Создаёт зарплату из словаря to_dict без разбора и проверок — для записей из нашего хранилища"""
+        salary = cls.__new__(cls)
+        salary.salary_from = data.get("from")
+        salary.salary_to = data.get("to")
+        salary.currency = sys.intern(data.get("currency") or "RUR")
+        salary.gross = data.get("gross")
+        return salary
+
+    @classmethod
+    def from_raw(cls, salary: Optional[Union[str, Dict, float]]) -> "Salary":
+        """Разбирает зарплату из ответа hh.ru, текстовой строки или числа из хранилища"""
+        if not salary:
+            return cls()
+        if isinstance(salary, (int, float)):
+            return cls(float(salary))
+        if isinstance(salary, dict):
+            salary_from = salary.get("from")
+            salary_to = salary.get("to")
+            return cls(
+                float(salary_from) if salary_from is not None else None,
+                float(salary_to) if salary_to is not None else None,
+                salary.get("currency") or "RUR",
+                salary.get("gross"),
+            )
+        if isinstance(salary, str):
+            return cls._from_text(salary)
+        return cls()
+
+    @classmethod
+    def _from_text(cls, text: str) -> "Salary":
+        """Разбирает строки вида «от 100 000 руб.», «до 3000 USD», «от 1000 до 2000 EUR», «100000-150000 руб.»"""
+        cleaned = text.replace("\u00a0", "").replace(" ", "")
+        numbers = [float(number.replace(",", ".")) for number in _NUMBER_RE.findall(cleaned)]
+        currency = "RUR"
+        for symbol in ("USD", "EUR", "KZT", "$", "€", "₸", "тенге"):
+            if symbol.lower() in text.lower():
+                currency = symbol
+                break
+        if not numbers:
+            return cls(currency=currency)
+        lowered = cleaned.lower()
+        if lowered.startswith("до"):
+            return cls(None, numbers[0], currency)
+        if lowered.startswith("от") and "до" in lowered and len(numbers) > 1:
+            return cls(numbers[0], numbers[1], currency)
+        if len(numbers) > 1 and "-" in cleaned:
+            return cls(numbers[0], numbers[1], currency)
+        return cls(numbers[0], None, currency)
+
+    @property
+    def amount(self) -> float:
+        """Значение для сравнения в исходной валюте: нижняя граница, а если её нет — верхняя"""
+        if self.salary_from is not None:
+            return self.salary_from
+        if self.salary_to is not None:
+            return self.salary_to
+        return 0.0
+
+    def normalized(self, rates: Optional[ExchangeRates] = None) -> float:
+        """Значение для сравнения в базовой валюте"""
+        return (rates or ExchangeRates.default()).convert(self.amount, self.currency)
+
+    def to_dict(self) -> Dict:
+        return {"from": self.salary_from, "to": self.salary_to, "currency": self.currency, "gross": self.gross}
+
+    def __str__(self) -> str:
+        """Вилка для вывода пользователю: «от 100000 до 150000 руб.», «до 3000 USD» или «Не указана»"""
+        parts = []
+        if self.salary_from is not None:
+            parts.append(f"от {_format_amount(self.salary_from)}")
+        if self.salary_to is not None:
+            parts.append(f"до {_format_amount(self.salary_to)}")
+        if not parts:
+            return "Не указана"
+        return f"{' '.join(parts)} {currency_label(self.currency)}"
+
+
+def _format_amount(amount: float) -> str:
+    return str(int(amount)) if float(amount).is_integer() else str(amount)
+
+
+def normalized_amount(salary_info: Dict, rates: Optional[ExchangeRates] = None) -> float:
+    """То же, что Salary.normalized, но прямо по сохранённому словарю — без создания объекта"""
+    amount = salary_info.get("from")
+    if amount is None:
+        amount = salary_info.get("to")
+    if amount is None:
+        return 0.0
+    return (rates or ExchangeRates.default()).convert(amount, salary_info.get("currency"))
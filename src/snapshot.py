@@ -0,0 +1,201 @@
+"""Бинарный снимок архива вакансий, который открывается через mmap без чтения всего файла.
+
+Формат (все числа little-endian):
+
+    заголовок        magic, версия, число записей и смещения секций (struct HEADER)
+    куча строк       UTF-8 строки подряд: title, link, description для каждой записи
+    колонки f8       salary, normalized, salary_from, salary_to (NaN — граница не указана)
+    колонка i1       gross: -1 — неизвестно, 0 — нет, 1 — да (дополняется нулями до границы 8 байт)
+    колонка u2       код валюты, индекс в таблице валют
+    смещения u8      3 * count + 1 смещений строк относительно начала кучи
+    таблица валют    JSON-список кодов валют
+
+Числовые колонки отдаются как массивы NumPy поверх mmap (без копирования), строки
+декодируются только для запрошенных записей.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from src.salary import Salary
+from src.vacancies import Vacancy
+
+MAGIC = b"VACSNAP\x00"
+VERSION = 2
+HEADER = struct.Struct("<8sIQQQQQQ")  # magic, version, count, heap, columns, offsets, currencies, currencies_size
+
+
+def _pad(file: BinaryIO, alignment: int = 8) -> None:
+    position = file.tell()
+    if position % alignment:
+        file.write(b"\x00" * (alignment - position % alignment))
+
+
+def _aligned(position: int, alignment: int = 8) -> int:
+    return (position + alignment - 1) // alignment * alignment
+
+
+def write_snapshot(filename: str, vacancies: Iterable[Vacancy]) -> int:
+    """Записывает вакансии в снимок потоком; возвращает число записей. Файл заменяется атомарно"""
+    salary, normalized, salary_from, salary_to = array("d"), array("d"), array("d"), array("d")
+    gross, currency_codes, offsets = array("b"), array("H"), array("Q", [0])
+    currencies: Dict[str, int] = {}
+    nan = float("nan")
+
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, "wb") as file:
+        file.write(b"\x00" * HEADER.size)
+        heap_offset = file.tell()
+        heap_size = 0
+        for vacancy in vacancies:
+            for text in (vacancy.title, vacancy.link, vacancy.description):
+                encoded = text.encode("utf-8")
+                file.write(encoded)
+                heap_size += len(encoded)
+                offsets.append(heap_size)
+            info = vacancy.salary_info
+            salary.append(vacancy.salary)
+            normalized.append(vacancy.normalized_salary)
+            salary_from.append(info.salary_from if info.salary_from is not None else nan)
+            salary_to.append(info.salary_to if info.salary_to is not None else nan)
+            gross.append(-1 if info.gross is None else int(info.gross))
+            currency_codes.append(currencies.setdefault(info.currency, len(currencies)))
+
+        _pad(file)
+        columns_offset = file.tell()
+        for column in (salary, normalized, salary_from, salary_to, gross):
+            column.tofile(file)
+        _pad(file)
+        currency_codes.tofile(file)
+        _pad(file)
+        offsets_offset = file.tell()
+        offsets.tofile(file)
+        currencies_offset = file.tell()
+        currencies_blob = json.dumps(list(currencies)).encode("utf-8")
+        file.write(currencies_blob)
+
+        file.seek(0)
+        file.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                len(salary),
+                heap_offset,
+                columns_offset,
+                offsets_offset,
+                currencies_offset,
+                len(currencies_blob),
+            )
+        )
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_filename, filename)
+    return len(salary)
+
+
+class VacancySnapshot:
+    """Снимок, открытый через mmap: колонки зарплат без копирования и доступ к записи по номеру"""
+
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._closed = False
+        (magic, version, count, heap, columns, offsets, currencies, currencies_size) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл {filename} не является снимком вакансий версии {VERSION}")
+
+        self._count: int = count
+        self._heap: int = heap
+        self.salary = self._column(np.float64, columns, 0)
+        self.normalized_salary = self._column(np.float64, columns, 1)
+        self.salary_from = self._column(np.float64, columns, 2)
+        self.salary_to = self._column(np.float64, columns, 3)
+        self.gross: np.ndarray = np.frombuffer(self._mmap, np.int8, count, columns + 4 * 8 * count)
+        codes_offset = _aligned(columns + 4 * 8 * count + count)  # после gross файл дополнен до 8 байт
+        self.currency_codes: np.ndarray = np.frombuffer(self._mmap, np.uint16, count, codes_offset)
+        self._offsets: np.ndarray = np.frombuffer(self._mmap, np.uint64, 3 * count + 1, offsets)
+        self.currencies: List[str] = json.loads(self._mmap[currencies:currencies + currencies_size])
+
+    def _column(self, dtype: type, columns_offset: int, index: int) -> np.ndarray:
+        return np.frombuffer(self._mmap, dtype, self._count, columns_offset + index * 8 * self._count)
+
+    def __enter__(self) -> "VacancySnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("Снимок закрыт")
+
+    def _string(self, index: int) -> str:
+        start = self._heap + int(self._offsets[index])
+        end = self._heap + int(self._offsets[index + 1])
+        return self._mmap[start:end].decode("utf-8")
+
+    def __getitem__(self, row: int) -> Vacancy:
+        """Читает одну запись, не трогая остальные"""
+        self._check_open()
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        salary_from, salary_to = float(self.salary_from[row]), float(self.salary_to[row])
+        gross = int(self.gross[row])
+        salary_info = Salary(
+            None if np.isnan(salary_from) else salary_from,
+            None if np.isnan(salary_to) else salary_to,
+            self.currencies[int(self.currency_codes[row])],
+            None if gross < 0 else bool(gross),
+        )
+        return Vacancy.from_trusted(
+            self._string(3 * row), self._string(3 * row + 1), float(self.salary[row]), self._string(3 * row + 2),
+            salary_info,
+        )
+
+    def rows_by_salary(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None) -> np.ndarray:
+        """Номера записей с зарплатой в базовой валюте в диапазоне — векторный проход по колонке"""
+        self._check_open()
+        mask = np.ones(self._count, dtype=bool)
+        if min_salary is not None:
+            mask &= self.normalized_salary >= min_salary
+        if max_salary is not None:
+            mask &= self.normalized_salary <= max_salary
+        return np.flatnonzero(mask)
+
+    def get_vacancies(self, min_salary: Optional[float] = None, max_salary: Optional[float] = None) -> List[Vacancy]:
+        """Вакансии с зарплатой в диапазоне; строки читаются только для найденных записей"""
+        return [self[int(row)] for row in self.rows_by_salary(min_salary, max_salary)]
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        self._check_open()
+        for row in range(self._count):
+            yield self[row]
+
+    def close(self) -> None:
+        """Освобождает массивы поверх mmap и закрывает файл.
+
+        Если у вызывающего остались представления колонок (например, col = snapshot.salary или срез),
+        отображение закрыть нельзя: оно освободится сборщиком мусора, когда исчезнет последнее из них.
+        После закрытия колонки пусты, а чтение записей бросает ValueError.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        empty = np.empty(0)
+        self.salary = self.normalized_salary = self.salary_from = self.salary_to = empty
+        self.gross = self.currency_codes = self._offsets = empty
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
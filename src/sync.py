@@ -0,0 +1,152 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set
+
+import requests
+
+from src.api_interactions import HeadHunterAPI
+from src.filehandler import FileHandler
+from src.vacancies import Vacancy
+
+HH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+class VacancySync:
+    """Инкрементальная синхронизация: по каждому запросу загружаются только вакансии новее прошлого запуска.
+
+    Для каждого запроса в файле состояния хранятся дата публикации самой свежей вакансии
+    (она уходит в hh.ru как date_from), id вакансий с этой датой (date_from включает границу)
+    и даты публикации сохранённых вакансий — по ним удаляются устаревшие.
+    """
+
+    def __init__(
+        self,
+        api: HeadHunterAPI,
+        storage: FileHandler,
+        state_filename: str = "sync_state.json",
+        max_age_days: Optional[int] = 30,
+    ):
+        self._api = api
+        self._storage = storage
+        self._state_filename = state_filename
+        self._max_age = timedelta(days=max_age_days) if max_age_days is not None else None
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Загружает состояние; если файла нет или он повреждён — начинает с нуля"""
+        try:
+            with open(self._state_filename, "r", encoding="utf-8") as file:
+                state = json.load(file)
+                return state if isinstance(state, dict) else {}
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _save_state(self) -> None:
+        temp_filename = f"{self._state_filename}.tmp"
+        with open(temp_filename, "w", encoding="utf-8") as file:
+            json.dump(self._state, file, ensure_ascii=False, indent=2)
+        os.replace(temp_filename, self._state_filename)
+
+    def high_water_mark(self, search_query: str) -> Optional[str]:
+        """Дата публикации самой свежей вакансии, загруженной по запросу"""
+        published_at: Optional[str] = self._state.get(search_query, {}).get("published_at")
+        return published_at
+
+    def _iter_new(self, search_query: str, query_state: Dict, archived: List[str]) -> Iterator[Dict]:
+        """Отдаёт вакансии новее отметки; архивные ссылки собирает в archived.
+
+        Выдача запрашивается от новых к старым. hh.ru отдаёт по запросу не больше MAX_DEPTH вакансий,
+        поэтому, если окно заполнено целиком, следующее окно запрашивается с date_to, равным дате
+        самой старой полученной вакансии. Отметка сдвигается, только если все окна загружены полностью:
+        иначе при следующем запуске непрочитанные вакансии будут запрошены снова. При первом запуске
+        отметки нет, и выдача ограничивается снизу max_age: более старые вакансии всё равно были бы удалены.
+        """
+        date_from = query_state.get("published_at")
+        request_from = date_from
+        if request_from is None and self._max_age is not None:
+            request_from = (datetime.now(timezone.utc) - self._max_age).strftime(HH_DATE_FORMAT)
+        previous_boundary = frozenset(query_state.get("boundary_ids", []))
+        newest, newest_raw = (_parse_date(date_from), date_from) if date_from else (None, None)
+        boundary_ids: Set[str] = set(previous_boundary)
+        fetched: Set[str] = set()
+        date_to: Optional[str] = None
+        complete = True
+
+        while True:
+            extra_params = {"order_by": "publication_time"}
+            if request_from:
+                extra_params["date_from"] = request_from
+            if date_to:
+                extra_params["date_to"] = date_to
+            received = 0
+            oldest, oldest_raw = None, None
+            try:
+                for item in self._api.iter_vacancies(search_query, extra_params, strict=True):
+                    received += 1
+                    published_at = item.get("published_at")
+                    published = _parse_date(published_at) if published_at else None
+                    if published is not None and (oldest is None or published < oldest):
+                        oldest, oldest_raw = published, published_at
+                    item_id = str(item.get("id"))
+                    if item_id in fetched:
+                        continue  # граница соседних окон попадает в оба
+                    fetched.add(item_id)
+                    if item.get("archived"):
+                        if item.get("alternate_url"):
+                            archived.append(item["alternate_url"])
+                        continue
+                    if published_at == date_from and item_id in previous_boundary:
+                        continue
+                    if published is not None:
+                        if newest is None or published > newest:
+                            newest, newest_raw, boundary_ids = published, published_at, set()
+                        if published == newest:
+                            boundary_ids.add(item_id)
+                        if item.get("alternate_url"):
+                            query_state["links"][item["alternate_url"]] = published_at
+                    yield item
+            except requests.exceptions.RequestException as e:
+                print(f"Ошибка синхронизации по запросу {search_query}: {e}")
+                complete = False
+                break
+            if received < self._api.MAX_DEPTH:
+                break
+            if oldest_raw is None or oldest_raw == date_to:
+                complete = False  # больше MAX_DEPTH вакансий с одной датой: дальше окно не сдвинуть
+                break
+            date_to = oldest_raw
+
+        if complete:
+            query_state["published_at"] = newest_raw
+            query_state["boundary_ids"] = sorted(boundary_ids)
+
+    def sync(self, search_query: str) -> int:
+        """Загружает новые вакансии по запросу в хранилище и удаляет устаревшие; возвращает число сохранённых"""
+        query_state = self._state.setdefault(search_query, {})
+        query_state.setdefault("links", {})
+        archived: List[str] = []
+
+        new_vacancies = Vacancy.iter_from_raw(self._iter_new(search_query, query_state, archived))
+        added = self._storage.add_batches(new_vacancies)
+        self._expire(query_state, archived)
+        self._save_state()
+        return added
+
+    def _expire(self, query_state: Dict, archived: List[str]) -> None:
+        """Удаляет из хранилища архивные вакансии и вакансии старше max_age_days"""
+        expired = set(archived)
+        if self._max_age is not None:
+            cutoff = datetime.now(timezone.utc) - self._max_age
+            links = query_state["links"]
+            expired.update(link for link, published_at in links.items() if _parse_date(published_at) < cutoff)
+        if not expired:
+            return
+        for link in expired:
+            query_state["links"].pop(link, None)
+        self._storage.delete_vacancies(expired)
+
+
+def _parse_date(value: str) -> datetime:
+    """Разбирает дату hh.ru вида 2025-06-01T10:00:00+0300"""
+    return datetime.strptime(value, HH_DATE_FORMAT)
@@ -1,14 +1,55 @@
-from typing import Optional, List, Dict, Union
+import sys
+from functools import lru_cache
+from typing import Optional, List, Dict, Iterable, Iterator, Union
 
+from src.salary import Salary
 
-class Vacancy:
-    __slots__ = ["_title", "_link", "_salary", "_description"]
 
-    def __init__(self, title: str, link: str, salary: Optional[Union[str, Dict]], description: str):
-        self._title = self._validate_title(title)
+class Vacancy:
+    __slots__ = ["_title", "_link", "_salary", "_description", "_salary_info", "_normalized"]
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        salary: Optional[Union[str, Dict, float]],
+        description: str,
+        salary_info: Optional[Dict] = None,
+    ):
+        # Названия часто повторяются («Бухгалтер», «Менеджер»), интернирование экономит память на архиве
+        self._title = sys.intern(self._validate_title(title))
         self._link = self._validate_link(link)
         self._description = description
         self._salary = self._parse_salary(salary)
+        # Полная зарплата: вилка и валюта; из хранилища приходит готовым словарём salary_info
+        self._salary_info = Salary.from_raw(salary_info if salary_info is not None else salary)
+        self._normalized: Optional[float] = None
+
+    @classmethod
+    def from_trusted(
+        cls, title: str, link: str, salary: float, description: str, salary_info: Optional[Salary] = None
+    ) -> "Vacancy":
+        """Создаёт вакансию из уже проверенных данных без валидации и разбора зарплаты"""
+        vacancy = cls.__new__(cls)
+        vacancy._title = sys.intern(title)
+        vacancy._link = link
+        vacancy._description = description
+        vacancy._salary = salary
+        vacancy._salary_info = salary_info if salary_info is not None else Salary.from_raw(salary)
+        vacancy._normalized = None
+        return vacancy
+
+    @classmethod
+    def from_record(cls, record: Dict) -> "Vacancy":
+        """Быстро восстанавливает вакансию из записи нашего хранилища (формат FileHandler._to_dict)"""
+        salary_info = record.get("salary_info")
+        return cls.from_trusted(
+            record["title"],
+            record["link"],
+            record["salary"],
+            record["description"],
+            Salary.from_stored(salary_info) if salary_info is not None else None,
+        )
 
     @staticmethod
     def _validate_title(title: str) -> str:
@@ -26,11 +67,15 @@ class Vacancy:
 
 
     @staticmethod
-    def _parse_salary(salary: Optional[Union[str, Dict]]) -> float:
+    def _parse_salary(salary: Optional[Union[str, Dict, float]]) -> float:
         """Обрабатывает зарплату из разных форматов и возвращает минимальное значение или 0"""
         if not salary:
             return 0.0
 
+        # Случай: salary — уже число (запись из нашего хранилища)
+        if isinstance(salary, (int, float)):
+            return float(salary)
+
         # Случай: salary — словарь с 'from' и 'to'
         if isinstance(salary, dict):
             min_salary = salary.get("from")
@@ -46,33 +91,42 @@ class Vacancy:
 
         # Случай: salary — строка
         if isinstance(salary, str):
-            cleaned = salary.replace("\u00a0", "").strip()
-            if "от" in cleaned:
-                try:
-                    return float(cleaned.replace("от", "").strip().split()[0])
-                except (ValueError, IndexError):
-                    return 0.0
-            elif "до" in cleaned:
-                return 0.0  # Зарплата "до" — не подходит для фильтрации по минимуму
-            elif "-" in cleaned:
-                try:
-                    return float(cleaned.split("-")[0].strip().split()[0])
-                except (ValueError, IndexError):
-                    return 0.0
-            else:
-                try:
-                    return float(cleaned.split()[0])
-                except (ValueError, IndexError):
-                    return 0.0
+            return Vacancy._parse_salary_text(salary)
 
         return 0.0
 
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_salary_text(salary: str) -> float:
+        """Разбирает зарплату-строку; результаты кэшируются, так как одинаковые строки повторяются часто"""
+        cleaned = salary.replace("\u00a0", "").strip()
+        if "от" in cleaned:
+            try:
+                return float(cleaned.replace("от", "").strip().split()[0])
+            except (ValueError, IndexError):
+                return 0.0
+        elif "до" in cleaned:
+            return 0.0  # Зарплата "до" — не подходит для фильтрации по минимуму
+        elif "-" in cleaned:
+            try:
+                return float(cleaned.split("-")[0].strip().split()[0])
+            except (ValueError, IndexError):
+                return 0.0
+        else:
+            try:
+                return float(cleaned.split()[0])
+            except (ValueError, IndexError):
+                return 0.0
+
     @classmethod
     def cast_to_object_list(cls, data: List[Dict]) -> List["Vacancy"]:
         """Преобразует сырые данные в список объектов Vacancy"""
-        vacancies = []
+        return list(cls.iter_from_raw(data))
 
+    @classmethod
+    def iter_from_raw(cls, data: Iterable[Dict]) -> Iterator["Vacancy"]:
+        """Лениво преобразует сырые данные в объекты Vacancy по одному"""
         for item in data:
             title = item.get("name")
             link = item.get("alternate_url")
@@ -85,14 +139,12 @@ class Vacancy:
                 continue  # ✅ Пропускаем некорректные вакансии
 
             try:
-                vacancies.append(cls(title, link, salary, requirement))
+                yield cls(title, link, salary, requirement)
             except ValueError as e:
                 # Можно логировать или игнорировать
                 print(f"Ошибка при инициализации вакансии: {e}")
                 continue
 
-        return vacancies
-
     @property
     def title(self) -> str:
         return self._title
@@ -109,19 +161,32 @@ class Vacancy:
     def description(self) -> str:
         return self._description
 
+    @property
+    def salary_info(self) -> Salary:
+        return self._salary_info
+
+    @property
+    def normalized_salary(self) -> float:
+        """Зарплата для сравнения, переведённая в базовую валюту по локальной таблице курсов; считается один раз"""
+        if self._normalized is None:
+            self._normalized = self._salary_info.normalized()
+        return self._normalized
+
     def __lt__(self, other: "Vacancy") -> bool:
-        return self.salary < other.salary
+        """Сравнение по зарплате в базовой валюте, как в sort_vacancies"""
+        return self.normalized_salary < other.normalized_salary
 
-    def __eq__(self, other: "Vacancy") -> bool:
-        return self.salary == other.salary
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Vacancy):
+            return NotImplemented
+        return self.normalized_salary == other.normalized_salary
 
 
     def __str__(self) -> str:
-        salary_str = f"{int(self.salary)}" if self.salary != 0 else "Не указана"
         desc_preview = self.description[:100] + "..." if len(self.description) > 100 else self.description
         return (
             f"{self.title}\n"
             f"Ссылка: {self.link}\n"
-            f"Зарплата: {salary_str} руб.\n"
+            f"Зарплата: {self.salary_info}\n"
             f"Описание: {desc_preview}"
         )
\ No newline at end of file
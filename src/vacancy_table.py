@@ -0,0 +1,196 @@
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from src.salary import ExchangeRates, Salary
+from src.vacancies import Vacancy
+
+
+class VacancyTable:
+    """Колоночное хранение пачки вакансий для векторных фильтров по зарплате.
+
+    Зарплаты лежат в массивах float64 (NaN — граница вилки не указана), валюта — целочисленными
+    кодами категорий, строки хранятся списками без копирования. Фильтры, сортировка и топ
+    сравнивают зарплаты в базовой валюте. Объекты Vacancy создаются только для строк,
+    которые возвращаются пользователю.
+    """
+
+    def __init__(
+        self,
+        titles: List[str],
+        links: List[str],
+        descriptions: List[str],
+        salary: np.ndarray,
+        salary_from: np.ndarray,
+        salary_to: np.ndarray,
+        gross: np.ndarray,
+        currency_codes: np.ndarray,
+        currencies: List[str],
+    ):
+        self._titles = titles
+        self._links = links
+        self._descriptions = descriptions
+        self.salary = salary
+        self.salary_from = salary_from
+        self.salary_to = salary_to
+        self.gross = gross
+        self.currency_codes = currency_codes
+        self.currencies = currencies
+
+    @classmethod
+    def _build(
+        cls, titles: List[str], links: List[str], descriptions: List[str], salary: List[float], infos: List[Salary]
+    ) -> "VacancyTable":
+        nan = np.nan
+        categories: Dict[str, int] = {}
+        codes = [categories.setdefault(info.currency, len(categories)) for info in infos]
+        return cls(
+            titles,
+            links,
+            descriptions,
+            np.array(salary, dtype=np.float64),
+            np.array([nan if i.salary_from is None else i.salary_from for i in infos], dtype=np.float64),
+            np.array([nan if i.salary_to is None else i.salary_to for i in infos], dtype=np.float64),
+            np.array([-1 if i.gross is None else int(i.gross) for i in infos], dtype=np.int8),
+            np.array(codes, dtype=np.int16),
+            list(categories),
+        )
+
+    @classmethod
+    def from_raw(cls, data: Iterable[Dict]) -> "VacancyTable":
+        """Строит таблицу из ответа hh.ru с теми же правилами отбора, что и Vacancy.cast_to_object_list"""
+        titles: List[str] = []
+        links: List[str] = []
+        descriptions: List[str] = []
+        salary: List[float] = []
+        infos: List[Salary] = []
+
+        for item in data:
+            title = item.get("name")
+            link = item.get("alternate_url")
+            if not title or not link or not link.startswith("http"):
+                continue
+            snippet = item.get("snippet", {})
+            raw_salary = item.get("salary")
+
+            titles.append(title)
+            links.append(link)
+            descriptions.append(snippet.get("requirement") or snippet.get("responsibility") or "Описание отсутствует")
+            salary.append(Vacancy._parse_salary(raw_salary))
+            infos.append(Salary.from_raw(raw_salary))
+
+        return cls._build(titles, links, descriptions, salary, infos)
+
+    @classmethod
+    def from_vacancies(cls, vacancies: Iterable[Vacancy]) -> "VacancyTable":
+        """Строит таблицу из готовых объектов Vacancy, вилка и валюта берутся из salary_info"""
+        vacancies = list(vacancies)
+        return cls._build(
+            [v.title for v in vacancies],
+            [v.link for v in vacancies],
+            [v.description for v in vacancies],
+            [v.salary for v in vacancies],
+            [v.salary_info for v in vacancies],
+        )
+
+    def __len__(self) -> int:
+        return len(self.salary)
+
+    def __getitem__(self, row: int) -> Vacancy:
+        salary_from, salary_to = float(self.salary_from[row]), float(self.salary_to[row])
+        gross = int(self.gross[row])
+        salary_info = Salary(
+            None if np.isnan(salary_from) else salary_from,
+            None if np.isnan(salary_to) else salary_to,
+            self.currencies[self.currency_codes[row]],
+            None if gross < 0 else bool(gross),
+        )
+        return Vacancy.from_trusted(
+            self._titles[row], self._links[row], float(self.salary[row]), self._descriptions[row], salary_info
+        )
+
+    def normalized_salary(self, rates: Optional[ExchangeRates] = None) -> np.ndarray:
+        """Зарплаты в базовой валюте, как Salary.normalized: нижняя граница, а если её нет — верхняя.
+
+        Один курс на категорию валюты, перевод — одно векторное умножение.
+        """
+        rates = rates or ExchangeRates.default()
+        factors = np.array([rates.factor(code or rates.base) or 0.0 for code in self.currencies], dtype=np.float64)
+        amount = np.where(np.isnan(self.salary_from), self.salary_to, self.salary_from)
+        normalized: np.ndarray = np.nan_to_num(amount, nan=0.0) * factors[self.currency_codes]
+        return normalized
+
+    def take(self, rows: np.ndarray) -> "VacancyTable":
+        """Возвращает таблицу из выбранных строк в указанном порядке"""
+        return VacancyTable(
+            [self._titles[row] for row in rows],
+            [self._links[row] for row in rows],
+            [self._descriptions[row] for row in rows],
+            self.salary[rows],
+            self.salary_from[rows],
+            self.salary_to[rows],
+            self.gross[rows],
+            self.currency_codes[rows],
+            self.currencies,
+        )
+
+    def salary_mask(
+        self,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        exclude_zero: bool = False,
+        rates: Optional[ExchangeRates] = None,
+    ) -> np.ndarray:
+        """Булева маска строк с зарплатой в базовой валюте в диапазоне [min_salary, max_salary]"""
+        normalized = self.normalized_salary(rates)
+        mask = np.ones(len(self), dtype=bool)
+        if min_salary is not None:
+            mask &= normalized >= min_salary
+        if max_salary is not None:
+            mask &= normalized <= max_salary
+        if exclude_zero:
+            mask &= normalized > 0
+        return mask
+
+    def filter_by_salary(
+        self,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        exclude_zero: bool = False,
+        rates: Optional[ExchangeRates] = None,
+    ) -> "VacancyTable":
+        """Оставляет строки с зарплатой в базовой валюте в диапазоне"""
+        return self.take(np.flatnonzero(self.salary_mask(min_salary, max_salary, exclude_zero, rates)))
+
+    def filter_by_currency(self, currency: str) -> "VacancyTable":
+        """Оставляет строки в указанной валюте"""
+        if currency not in self.currencies:
+            return self.take(np.array([], dtype=np.intp))
+        return self.take(np.flatnonzero(self.currency_codes == self.currencies.index(currency)))
+
+    def sort_by_salary(self, descending: bool = True, rates: Optional[ExchangeRates] = None) -> "VacancyTable":
+        """Сортирует по зарплате в базовой валюте; при равной зарплате сохраняется исходный порядок"""
+        normalized = self.normalized_salary(rates)
+        keys = -normalized if descending else normalized
+        return self.take(np.argsort(keys, kind="stable"))
+
+    def top_rows(self, n: int, rates: Optional[ExchangeRates] = None) -> np.ndarray:
+        """Номера n строк с наибольшей зарплатой в базовой валюте, как при стабильной сортировке по убыванию"""
+        if n <= 0 or not len(self):
+            return np.array([], dtype=np.intp)
+        normalized = self.normalized_salary(rates)
+        if n >= len(self):
+            return np.argsort(-normalized, kind="stable")
+        threshold = np.partition(normalized, len(self) - n)[len(self) - n]
+        above = np.flatnonzero(normalized > threshold)
+        ties = np.flatnonzero(normalized == threshold)[: n - len(above)]
+        rows = np.concatenate([above, ties])
+        return rows[np.argsort(-normalized[rows], kind="stable")]
+
+    def top(self, n: int, rates: Optional[ExchangeRates] = None) -> List[Vacancy]:
+        """N вакансий с наибольшей зарплатой в базовой валюте, объекты создаются только для них"""
+        return [self[row] for row in self.top_rows(n, rates)]
+
+    def to_vacancies(self) -> List[Vacancy]:
+        """Создаёт объекты Vacancy для всех строк"""
+        return [self[row] for row in range(len(self))]
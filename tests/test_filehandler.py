@@ -1,9 +1,13 @@
 import os
 import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
-from src.filehandler import JSONSaver
+from src.filehandler import JSONLinesSaver, JSONSaver, SQLiteSaver
 from src.vacancies import Vacancy
 
 @pytest.fixture
@@ -12,8 +16,9 @@ def test_json_file():
     if os.path.exists(filename):
         os.remove(filename)
     yield filename
-    if os.path.exists(filename):
-        os.remove(filename)
+    for path in (filename, f"{filename}.lock"):
+        if os.path.exists(path):
+            os.remove(path)
 
 def test_json_saver_add_vacancy(test_json_file):
     """Проверяет добавление вакансии в файл"""
@@ -48,3 +53,437 @@ def test_json_saver_delete_vacancy(test_json_file):
     with open(test_json_file, "r", encoding="utf-8") as file:
         data = json.load(file)
     assert data == []
+
+
+def test_json_saver_add_stream_saves_in_batches(test_json_file):
+    """Проверяет, что поток сохраняется пачками ещё до окончания чтения"""
+    saver = JSONSaver(test_json_file)
+    vacancies = (Vacancy(f"Вакансия {i}", f"https://example.com/{i}", "100000", "Описание") for i in range(5))
+    stream = saver.add_stream(vacancies, batch_size=2)
+
+    passed = [next(stream) for _ in range(3)]
+    assert [v.title for v in passed] == ["Вакансия 0", "Вакансия 1", "Вакансия 2"]
+    assert len(saver.get_vacancies()) == 2
+
+    passed.extend(stream)
+    assert len(passed) == 5
+    assert len(saver.get_vacancies()) == 5
+
+
+def test_json_saver_add_vacancies_single_write(test_json_file, monkeypatch):
+    """Проверяет, что пакет сохраняется одной записью, а дубли по ссылке отбрасываются"""
+    saver = JSONSaver(test_json_file)
+    saver.add_vacancy(Vacancy("Старая", "https://example.com/0", "100000", "Описание"))
+
+    saves = []
+    original_save = saver._save_data
+    monkeypatch.setattr(saver, "_save_data", lambda data: (saves.append(len(data)), original_save(data)))
+    saver.add_vacancies([
+        Vacancy("Дубль старой", "https://example.com/0", "200000", "Описание"),
+        Vacancy("Новая", "https://example.com/1", "100000", "Описание"),
+        Vacancy("Дубль новой", "https://example.com/1", "100000", "Описание"),
+    ])
+
+    assert saves == [2]
+    assert [v.title for v in saver.get_vacancies()] == ["Старая", "Новая"]
+
+
+@pytest.fixture
+def test_jsonl_file(tmp_path):
+    return str(tmp_path / "vacancies.jsonl")
+
+
+def test_jsonl_saver_appends_and_tombstones(test_jsonl_file):
+    """Проверяет, что добавление и удаление только дописывают строки в файл"""
+    saver = JSONLinesSaver(test_jsonl_file)
+    first = Vacancy("Python Developer", "https://example.com/1", "100000", "Описание")
+    second = Vacancy("Java Developer", "https://example.com/2", "150000", "Описание")
+    saver.add_vacancies([first, second, first])
+    saver.delete_vacancy(first)
+
+    with open(test_jsonl_file, "r", encoding="utf-8") as file:
+        lines = [json.loads(line) for line in file]
+    assert len(lines) == 3
+    assert lines[2] == {"link": "https://example.com/1", "deleted": True}
+    assert [v.title for v in saver.get_vacancies()] == ["Java Developer"]
+    assert [v.title for v in saver.get_vacancies(salary_range="120000-200000")] == ["Java Developer"]
+
+
+def test_jsonl_saver_reopen_and_readd(test_jsonl_file):
+    """Проверяет восстановление индекса при открытии и повторное добавление удалённой вакансии"""
+    vacancy = Vacancy("Python Developer", "https://example.com/1", "100000", "Описание")
+    saver = JSONLinesSaver(test_jsonl_file)
+    saver.add_vacancy(vacancy)
+    saver.delete_vacancy(vacancy)
+    saver.add_vacancy(Vacancy("Python Senior", "https://example.com/1", "300000", "Описание"))
+
+    reopened = JSONLinesSaver(test_jsonl_file)
+    assert [(v.title, v.salary) for v in reopened.get_vacancies()] == [("Python Senior", 300000)]
+
+
+def test_jsonl_saver_compact(test_jsonl_file):
+    """Проверяет, что уплотнение по порогу оставляет в файле только живые записи"""
+    saver = JSONLinesSaver(test_jsonl_file, compact_threshold=0.5, compact_min_lines=4)
+    vacancies = [Vacancy(f"Вакансия {i}", f"https://example.com/{i}", "100000", "Описание") for i in range(3)]
+    saver.add_vacancies(vacancies)
+    saver.delete_vacancy(vacancies[0])  # 4 строки, 2 мёртвые — порог не превышен
+    saver.delete_vacancy(vacancies[1])  # 5 строк, 4 мёртвые — уплотнение
+
+    with open(test_jsonl_file, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+    assert len(lines) == 1
+    assert [v.title for v in saver.get_vacancies()] == ["Вакансия 2"]
+
+
+def test_jsonl_saver_skips_truncated_line(test_jsonl_file):
+    """Проверяет, что недописанная при сбое строка не ломает чтение и запись"""
+    with open(test_jsonl_file, "w", encoding="utf-8") as file:
+        file.write(
+            '{"title": "Целая", "link": "https://example.com/1", "salary": 0.0, "description": ""}\n'
+            '{"title": "Обор'
+        )
+    saver = JSONLinesSaver(test_jsonl_file)
+    saver.add_vacancy(Vacancy("Новая", "https://example.com/2", "100000", "Описание"))
+
+    assert [v.title for v in JSONLinesSaver(test_jsonl_file).get_vacancies()] == ["Целая", "Новая"]
+
+
+def test_jsonl_saver_skips_non_object_lines(test_jsonl_file):
+    """Проверяет, что строки с JSON, но не объектом, пропускаются при чтении, удалении и уплотнении"""
+    with open(test_jsonl_file, "w", encoding="utf-8") as file:
+        file.write(
+            '[1, 2]\n"строка"\n'
+            '{"title": "Целая", "link": "https://example.com/1", "salary": 0.0, "description": ""}\n'
+        )
+    saver = JSONLinesSaver(test_jsonl_file)
+
+    assert [v.title for v in saver.get_vacancies()] == ["Целая"]
+    assert saver.delete_where(salary_range="0-0") == 1
+    saver.compact()
+    assert saver.get_vacancies() == []
+
+
+@pytest.fixture
+def sqlite_saver(tmp_path):
+    saver = SQLiteSaver(str(tmp_path / "vacancies.db"))
+    yield saver
+    saver.close()
+
+
+def test_sqlite_saver_keyword_and_salary_search(sqlite_saver):
+    """Проверяет поиск по ключевым словам (без учёта регистра) и диапазону зарплат"""
+    sqlite_saver.add_vacancies([
+        Vacancy("Python Developer", "https://example.com/1", "100000", "Разработка на Django"),
+        Vacancy("Бухгалтер", "https://example.com/2", "80000", "Отчётность и налоги"),
+        Vacancy("Java Developer", "https://example.com/3", "200000", "Spring Boot"),
+        Vacancy("Python Developer", "https://example.com/1", "500000", "Дубль по ссылке"),
+    ])
+
+    assert len(sqlite_saver.get_vacancies()) == 3
+    assert [v.title for v in sqlite_saver.get_vacancies(keywords=["PYTHON", "отчётн"])] == [
+        "Python Developer",
+        "Бухгалтер",
+    ]
+    assert [v.salary for v in sqlite_saver.get_vacancies(keywords=["developer"], salary_range="150000-250000")] == [
+        200000
+    ]
+
+
+def test_sqlite_saver_delete_vacancy(sqlite_saver):
+    """Проверяет, что удалённая вакансия пропадает и из полнотекстового индекса"""
+    vacancy = Vacancy("Python Developer", "https://example.com/1", "100000", "Описание")
+    sqlite_saver.add_vacancy(vacancy)
+    sqlite_saver.delete_vacancy(vacancy)
+
+    assert sqlite_saver.get_vacancies() == []
+    assert sqlite_saver.get_vacancies(keywords=["python"]) == []
+
+
+def test_sqlite_saver_import_json(sqlite_saver, test_json_file):
+    """Проверяет перенос вакансий из JSON-файла"""
+    json_saver = JSONSaver(test_json_file)
+    json_saver.add_vacancies([
+        Vacancy("Python Developer", "https://example.com/1", "100000", "Описание"),
+        Vacancy("Бухгалтер", "https://example.com/2", "80000", "Описание"),
+    ])
+
+    assert sqlite_saver.import_json(test_json_file) == 2
+    assert sqlite_saver.import_json(test_json_file) == 0
+    assert [v.salary for v in sqlite_saver.get_vacancies(salary_range="90000-110000")] == [100000]
+
+
+def test_sqlite_saver_keeps_currency(sqlite_saver, test_json_file, tmp_path):
+    """Проверяет, что SQLiteSaver хранит валюту, ищет по зарплате в базовой валюте и переносит её из JSON"""
+    vacancies = [
+        Vacancy("Рубли", "https://example.com/1", {"from": 3000, "currency": "RUR"}, "Описание"),
+        Vacancy("Доллары", "https://example.com/2", {"to": 3000, "currency": "USD", "gross": True}, "Описание"),
+    ]
+    sqlite_saver.add_vacancies(vacancies)
+    found = sqlite_saver.get_vacancies(salary_range="100000-1000000")
+    assert [v.title for v in found] == ["Доллары"]
+    assert found[0].salary_info.to_dict() == {"from": None, "to": 3000, "currency": "USD", "gross": True}
+
+    JSONSaver(test_json_file).add_vacancies(vacancies)
+    imported = SQLiteSaver(str(tmp_path / "imported.db"))
+    assert imported.import_json(test_json_file) == 2
+    assert [v.salary_info.currency for v in imported.get_vacancies()] == ["RUR", "USD"]
+    imported.export_snapshot(str(tmp_path / "vacancies.snap"))
+    imported.close()
+    with SQLiteSaver.open_snapshot(str(tmp_path / "vacancies.snap")) as snapshot:
+        assert snapshot.currencies == ["RUR", "USD"]
+        assert [v.title for v in snapshot.get_vacancies(min_salary=100000)] == ["Доллары"]
+
+
+def test_sqlite_saver_migrates_old_schema(tmp_path):
+    """Проверяет, что база без колонок валюты дополняется ими, а старые суммы считаются рублями"""
+    filename = str(tmp_path / "old.db")
+    connection = sqlite3.connect(filename)
+    connection.execute(
+        "CREATE TABLE vacancies (id INTEGER PRIMARY KEY, link TEXT NOT NULL UNIQUE, title TEXT NOT NULL, "
+        "salary REAL NOT NULL, description TEXT NOT NULL)"
+    )
+    connection.execute("INSERT INTO vacancies (link, title, salary, description) VALUES ('l', 'Старая', 1e5, '')")
+    connection.commit()
+    connection.close()
+
+    with SQLiteSaver(filename) as saver:
+        found = saver.get_vacancies(salary_range="90000-110000")
+        assert [v.title for v in found] == ["Старая"]
+        assert found[0].salary_info.currency == "RUR"
+
+
+def test_json_saver_cached_reads_once(test_json_file, monkeypatch):
+    """Проверяет, что в режиме кэша неизменённый файл не перечитывается"""
+    JSONSaver(test_json_file).add_vacancy(Vacancy("Python Developer", "https://example.com/1", "100000", "Описание"))
+    saver = JSONSaver(test_json_file, cached=True)
+    loads = []
+    original_load = json.load
+    monkeypatch.setattr(json, "load", lambda file: (loads.append(1), original_load(file))[1])
+
+    first = saver.get_vacancies()
+    second = saver.get_vacancies(keywords=["python"])
+    assert len(loads) == 1
+    assert first[0] is second[0]
+
+
+def test_json_saver_cached_invalidates_on_external_change(test_json_file):
+    """Проверяет, что кэш сбрасывается, если файл изменил другой процесс"""
+    saver = JSONSaver(test_json_file, cached=True)
+    assert saver.get_vacancies() == []
+
+    JSONSaver(test_json_file).add_vacancy(Vacancy("Python Developer", "https://example.com/1", "100000", "Описание"))
+    assert [v.title for v in saver.get_vacancies()] == ["Python Developer"]
+
+
+def test_json_saver_cached_flush(test_json_file):
+    """Проверяет, что изменения попадают в файл только при flush или выходе из with"""
+    with JSONSaver(test_json_file, cached=True) as saver:
+        saver.add_vacancy(Vacancy("Python Developer", "https://example.com/1", "100000", "Описание"))
+        saver.add_vacancy(Vacancy("Java Developer", "https://example.com/2", "100000", "Описание"))
+        assert len(saver.get_vacancies()) == 2
+        with open(test_json_file, "r", encoding="utf-8") as file:
+            assert json.load(file) == []
+
+    with open(test_json_file, "r", encoding="utf-8") as file:
+        assert len(json.load(file)) == 2
+
+
+def test_json_saver_cached_keyword_index_updates(test_json_file):
+    """Проверяет, что индекс ключевых слов в режиме кэша следит за добавлением и удалением"""
+    saver = JSONSaver(test_json_file, cached=True)
+    python_dev = Vacancy("Python Developer", "https://example.com/1", "100000", "Django")
+    saver.add_vacancy(python_dev)
+    assert [v.title for v in saver.get_vacancies(keywords=["python"])] == ["Python Developer"]
+
+    saver.add_vacancy(Vacancy("Python Senior", "https://example.com/2", "300000", "FastAPI"))
+    saver.delete_vacancy(python_dev)
+    assert [v.title for v in saver.get_vacancies(keywords=["python"], salary_range="200000-400000")] == [
+        "Python Senior"
+    ]
+
+
+def test_json_saver_cached_keywords_match_uncached(test_json_file):
+    """Проверяет, что кэш с индексом находит по ключевым словам то же, что и обычный поиск подстроки"""
+    JSONSaver(test_json_file).add_vacancies(
+        [
+            Vacancy("Python Developer", "https://example.com/1", "100000", "Django"),
+            Vacancy("CPython contributor", "https://example.com/2", "100000", "C++"),
+            Vacancy("C# Developer", "https://example.com/3", "100000", ".NET"),
+        ]
+    )
+    plain, cached = JSONSaver(test_json_file), JSONSaver(test_json_file, cached=True)
+    for keywords in (["python"], ["ev"], ["c++"], [".net"], ["c"]):
+        expected = [v.link for v in plain.get_vacancies(keywords=keywords)]
+        assert [v.link for v in cached.get_vacancies(keywords=keywords)] == expected
+
+
+def test_json_saver_salary_range_uses_base_currency(test_json_file):
+    """Проверяет, что фильтр по зарплате в хранилище учитывает валюту"""
+    saver = JSONSaver(test_json_file)
+    saver.add_vacancies([
+        Vacancy("Рубли", "https://example.com/1", {"from": 3000, "currency": "RUR"}, "Описание"),
+        Vacancy("Доллары", "https://example.com/2", {"from": 3000, "currency": "USD"}, "Описание"),
+    ])
+
+    found = saver.get_vacancies(salary_range="100000-1000000")
+    assert [v.title for v in found] == ["Доллары"]
+    assert found[0].salary_info.currency == "USD"
+
+
+def add_worker_vacancies(filename, worker, count):
+    saver = JSONSaver(filename)
+    for i in range(count):
+        saver.add_vacancy(Vacancy(f"Вакансия {worker}-{i}", f"https://example.com/{worker}/{i}", "100000", "Описание"))
+
+
+def test_json_saver_concurrent_processes(tmp_path):
+    """Проверяет, что параллельные процессы, пишущие в один файл, не теряют вакансии"""
+    filename = str(tmp_path / "vacancies.json")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(add_worker_vacancies, [filename] * 4, range(4), [25] * 4))
+
+    assert len(JSONSaver(filename).get_vacancies()) == 100
+    assert not os.path.exists(f"{filename}.tmp")
+
+
+def test_json_saver_group_commit(tmp_path, monkeypatch):
+    """Проверяет, что добавления, ждущие записи в других потоках, уходят в файл одной записью"""
+    saver = JSONSaver(str(tmp_path / "vacancies.json"), group_commit=True)
+    writes = []
+    original_write = saver._write_file
+    monkeypatch.setattr(saver, "_write_file", lambda data: (writes.append(len(data)), original_write(data)))
+
+    threads = [
+        threading.Thread(
+            target=saver.add_vacancy,
+            args=(Vacancy(f"Вакансия {i}", f"https://example.com/{i}", "100000", "Описание"),),
+        )
+        for i in range(4)
+    ]
+    with saver._commit_lock:  # пока идёт «чужая» запись, пачки копятся в очереди
+        for thread in threads:
+            thread.start()
+        while len(saver._commit_queue) < 4:
+            time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+
+    assert writes == [4]
+    assert len(saver.get_vacancies()) == 4
+
+
+def test_savers_read_stream_outside_lock(tmp_path):
+    """Проверяет, что поток вакансий читается до блокировки файла и до начала транзакции SQLite"""
+    fcntl = pytest.importorskip("fcntl")
+    json_filename, db_filename = str(tmp_path / "vacancies.json"), str(tmp_path / "vacancies.db")
+    json_saver, sqlite_saver = JSONSaver(json_filename), SQLiteSaver(db_filename)
+
+    def stream(check):
+        for i in range(3):
+            check()
+            yield Vacancy(f"Вакансия {i}", f"https://example.com/{i}", "100000", "Описание")
+
+    def json_lock_is_free():
+        with open(f"{json_filename}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def sqlite_is_writable():
+        connection = sqlite3.connect(db_filename, timeout=0)
+        with connection:
+            connection.execute("DELETE FROM vacancies WHERE link = 'https://example.com/none'")
+        connection.close()
+
+    assert json_saver.add_vacancies(stream(json_lock_is_free)) == 3
+    assert sqlite_saver.add_vacancies(stream(sqlite_is_writable)) == 3
+    sqlite_saver.close()
+
+
+def test_json_saver_cached_flush_merges_external_changes(test_json_file):
+    """Проверяет, что flush кэша не затирает вакансии, добавленные другим процессом"""
+    JSONSaver(test_json_file).add_vacancy(Vacancy("Старая", "https://example.com/0", "100000", "Описание"))
+    with JSONSaver(test_json_file, cached=True) as saver:
+        saver.delete_vacancy(saver.get_vacancies()[0])
+        saver.add_vacancy(Vacancy("Из кэша", "https://example.com/1", "100000", "Описание"))
+        JSONSaver(test_json_file).add_vacancy(Vacancy("Снаружи", "https://example.com/2", "100000", "Описание"))
+
+    assert sorted(v.title for v in JSONSaver(test_json_file).get_vacancies()) == ["Из кэша", "Снаружи"]
+
+
+def make_salary_vacancies():
+    return [
+        Vacancy(f"Вакансия {i}", f"https://example.com/{i}", str(salary), "Описание")
+        for i, salary in enumerate([50000, 100000, 150000, 200000])
+    ]
+
+
+def test_json_saver_delete_vacancies_single_write(test_json_file, monkeypatch):
+    """Проверяет, что удаление многих ссылок — одна запись файла"""
+    saver = JSONSaver(test_json_file)
+    saver.add_vacancies(make_salary_vacancies())
+    saves = []
+    original_save = saver._save_data
+    monkeypatch.setattr(saver, "_save_data", lambda data: (saves.append(len(data)), original_save(data)))
+
+    deleted = saver.delete_vacancies(["https://example.com/0", "https://example.com/2", "https://example.com/404"])
+    assert deleted == 2
+    assert saves == [2]
+    assert [v.title for v in saver.get_vacancies()] == ["Вакансия 1", "Вакансия 3"]
+    assert saver.delete_vacancies(["https://example.com/404"]) == 0
+    assert saves == [2]
+
+
+def test_json_saver_delete_where(test_json_file):
+    """Проверяет удаление по диапазону зарплат и по произвольному условию"""
+    saver = JSONSaver(test_json_file)
+    saver.add_vacancies(make_salary_vacancies())
+
+    assert saver.delete_where(salary_range="100000-150000") == 2
+    assert saver.delete_where(lambda v: v.title.endswith("3")) == 1
+    assert [v.title for v in saver.get_vacancies()] == ["Вакансия 0"]
+    with pytest.raises(ValueError):
+        saver.delete_where()
+
+
+def test_json_saver_cached_delete_vacancies_updates_index(test_json_file):
+    """Проверяет, что массовое удаление в режиме кэша обновляет индексы и попадает в файл при flush"""
+    with JSONSaver(test_json_file, cached=True) as saver:
+        saver.add_vacancies(make_salary_vacancies())
+        assert len(saver.get_vacancies(salary_range="0-1000000")) == 4
+        saver.delete_vacancies(["https://example.com/1", "https://example.com/3"])
+        assert [v.title for v in saver.get_vacancies(salary_range="0-1000000")] == ["Вакансия 0", "Вакансия 2"]
+
+    assert [v.title for v in JSONSaver(test_json_file).get_vacancies()] == ["Вакансия 0", "Вакансия 2"]
+
+
+def test_jsonl_saver_delete_vacancies_and_where(test_jsonl_file):
+    """Проверяет, что массовое удаление дописывает надгробия одной операцией"""
+    saver = JSONLinesSaver(test_jsonl_file)
+    saver.add_vacancies(make_salary_vacancies())
+
+    assert saver.delete_vacancies(["https://example.com/0", "https://example.com/0", "https://example.com/404"]) == 1
+    assert saver.delete_where(salary_range="150000-250000") == 2
+    with open(test_jsonl_file, "r", encoding="utf-8") as file:
+        assert len(file.readlines()) == 7
+    assert [v.title for v in JSONLinesSaver(test_jsonl_file).get_vacancies()] == ["Вакансия 1"]
+
+
+def test_sqlite_saver_delete_vacancies_and_where(sqlite_saver):
+    """Проверяет массовое удаление и удаление по условию в SQLite"""
+    sqlite_saver.add_vacancies(make_salary_vacancies())
+
+    assert sqlite_saver.delete_vacancies(["https://example.com/0", "https://example.com/404"]) == 1
+    assert sqlite_saver.delete_where(salary_range="190000-250000") == 1
+    assert sqlite_saver.delete_where(lambda v: v.salary > 120000, salary_range="0-1000000") == 1
+    assert [v.title for v in sqlite_saver.get_vacancies()] == ["Вакансия 1"]
+
+
+def test_sqlite_saver_delete_where_uses_base_currency(sqlite_saver):
+    """Проверяет, что удаление по диапазону зарплат в SQLite учитывает валюту"""
+    sqlite_saver.add_vacancies([
+        Vacancy("Рубли", "https://example.com/1", {"from": 3000, "currency": "RUR"}, "Описание"),
+        Vacancy("Доллары", "https://example.com/2", {"from": 3000, "currency": "USD"}, "Описание"),
+    ])
+
+    assert sqlite_saver.delete_where(salary_range="100000-1000000") == 1
+    assert [v.title for v in sqlite_saver.get_vacancies()] == ["Рубли"]
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from src.http_cache import ResponseCache
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def test_response_cache_key_is_normalised():
+    """Проверяет, что порядок параметров и лишние пробелы не влияют на ключ"""
+    first = ResponseCache.make_key("https://api.hh.ru/vacancies", {"text": " python  django", "per_page": 100})
+    second = ResponseCache.make_key("https://api.hh.ru/vacancies", {"per_page": "100", "text": "python django"})
+    assert first == second
+
+
+def test_response_cache_ttl(cache_file, monkeypatch):
+    """Проверяет, что запись устаревает по TTL и продлевается через touch"""
+    cache = ResponseCache(cache_file, ttl=60)
+    cache.put("key", b'{"items": []}', etag='"abc"')
+    entry = cache.get("key")
+    assert entry.body == b'{"items": []}'
+    assert entry.etag == '"abc"'
+    assert cache.is_fresh(entry)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert not cache.is_fresh(cache.get("key"))
+    cache.touch("key")
+    assert cache.is_fresh(cache.get("key"))
+
+
+def test_response_cache_evicts_least_recently_used(cache_file, monkeypatch):
+    """Проверяет вытеснение давно не использованных записей при превышении размера"""
+    clock = iter(range(1000))
+    monkeypatch.setattr(time, "time", lambda: float(next(clock)))
+    cache = ResponseCache(cache_file, max_bytes=25)
+    cache.put("a", b"x" * 10)
+    cache.put("b", b"x" * 10)
+    cache.get("a")
+    cache.put("c", b"x" * 10)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
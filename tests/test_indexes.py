@@ -0,0 +1,98 @@
+from src.indexes import KeywordIndex, SalaryIndex
+from src.vacancies import Vacancy
+
+
+def make_vacancies():
+    return [
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", "100000", "Django и <highlighttext>SQL"),
+        Vacancy("Бухгалтер", "https://hh.ru/vacancy/2", "80000", "Отчётность, 1С"),
+        Vacancy("Java Developer", "https://hh.ru/vacancy/3", "150000", "Spring, SQL"),
+    ]
+
+
+def test_keyword_index_tokenize():
+    """Проверяет нормализацию слов: регистр, ё, теги подсветки"""
+    assert KeywordIndex.tokenize("<highlighttext>Отчётность</highlighttext> Python3") == {"отчетность", "python3"}
+
+
+def test_keyword_index_any_and_all():
+    """Проверяет поиск по любому и по всем словам"""
+    index = KeywordIndex.from_vacancies(make_vacancies())
+
+    assert len(index.search(["sql", "бухгалтер"])) == 3
+    assert [v.title for v in index.search(["SQL", "django"], match_all=True)] == ["Python разработчик"]
+    assert index.search(["kotlin"]) == []
+
+
+def test_keyword_index_prefix():
+    """Проверяет поиск по началу слова"""
+    index = KeywordIndex.from_vacancies(make_vacancies())
+
+    assert index.search(["разраб"]) == []
+    assert [v.title for v in index.search(["разраб", "отчёт"], prefix=True)] == ["Python разработчик", "Бухгалтер"]
+
+
+def test_keyword_index_incremental_update():
+    """Проверяет обновление индекса при добавлении и удалении"""
+    vacancies = make_vacancies()
+    index = KeywordIndex.from_vacancies(vacancies[:2])
+    index.add(vacancies[2].link, f"{vacancies[2].title} {vacancies[2].description}", vacancies[2])
+    index.remove(vacancies[0].link)
+
+    assert len(index) == 2
+    assert vacancies[0].link not in index
+    assert [v.title for v in index.search(["sql"])] == ["Java Developer"]
+    assert index.search(["django"], prefix=True) == []
+
+
+def test_keyword_index_substring_matches_plain_search():
+    """Проверяет, что режим substring совпадает с поиском подстроки по тексту, включая пунктуацию"""
+    vacancies = make_vacancies() + [
+        Vacancy("CPython contributor", "https://hh.ru/vacancy/4", "0", "C++ и .NET"),
+        Vacancy("C# Developer", "https://hh.ru/vacancy/5", "0", "ASP NET"),
+    ]
+    index = KeywordIndex.from_vacancies(vacancies)
+
+    for keyword in ["python", "ev", "c++", ".net", "sql", "1с", "и .n"]:
+        expected = [v for v in vacancies if keyword in f"{v.title} {v.description}".lower()]
+        assert index.search([keyword], substring=True) == expected, keyword
+
+
+def make_salary_vacancies():
+    salaries = [120000, 0, 80000, 200000, 120000, 150000]
+    return [Vacancy(f"Вакансия {i}", f"https://hh.ru/vacancy/{i}", str(s), "") for i, s in enumerate(salaries)]
+
+
+def test_salary_index_between():
+    """Проверяет выборку диапазона зарплат с включёнными границами"""
+    index = SalaryIndex.from_vacancies(make_salary_vacancies())
+
+    assert [v.salary for v in index.between(100000, 150000)] == [120000, 120000, 150000]
+    assert [v.title for v in index.between(100000, 150000, insertion_order=True)] == [
+        "Вакансия 0",
+        "Вакансия 4",
+        "Вакансия 5",
+    ]
+    assert [v.salary for v in index.between(min_salary=150000)] == [150000, 200000]
+    assert index.between(300000) == []
+
+
+def test_salary_index_top_matches_stable_sort():
+    """Проверяет, что топ совпадает со стабильной сортировкой по убыванию"""
+    vacancies = make_salary_vacancies()
+    index = SalaryIndex.from_vacancies(vacancies)
+
+    expected = sorted(vacancies, key=lambda v: v.salary, reverse=True)
+    assert [v.title for v in index.top(4)] == [v.title for v in expected[:4]]
+    assert [v.title for v in index.top(2, max_salary=130000)] == ["Вакансия 0", "Вакансия 4"]
+
+
+def test_salary_index_incremental_update():
+    """Проверяет добавление, замену и удаление записей"""
+    vacancies = make_salary_vacancies()
+    index = SalaryIndex.from_vacancies(vacancies)
+    index.remove(vacancies[3].link)
+    index.add(vacancies[1].link, 500000, vacancies[1])
+
+    assert len(index) == 5
+    assert [v.title for v in index.top(2)] == ["Вакансия 1", "Вакансия 5"]
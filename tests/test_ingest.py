@@ -0,0 +1,66 @@
+import json
+
+from src.ingest import VacancyRecord, ingest_dumps, ingest_items, iter_dump_files
+
+
+def raw_vacancy(index, salary=None):
+    return {
+        "name": f"Вакансия {index}",
+        "alternate_url": f"https://hh.ru/vacancy/{index}",
+        "salary": salary,
+        "snippet": {"requirement": "Python"},
+    }
+
+
+def test_ingest_dumps_from_directory(tmp_path):
+    """Проверяет разбор каталога с выгрузками в разных форматах с сохранением порядка файлов"""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "a.json").write_text(json.dumps({"items": [raw_vacancy(1, {"from": 100000}), {"name": ""}]}))
+    (tmp_path / "nested" / "b.json").write_text(json.dumps([raw_vacancy(2, "от 50000 руб.")]))
+    (tmp_path / "notes.txt").write_text("не выгрузка")
+
+    assert list(iter_dump_files([str(tmp_path)])) == [str(tmp_path / "a.json"), str(tmp_path / "nested" / "b.json")]
+
+    records = list(ingest_dumps([str(tmp_path)], workers=2))
+    assert [record[:4] for record in records] == [
+        ("Вакансия 1", "https://hh.ru/vacancy/1", 100000.0, "Python"),
+        ("Вакансия 2", "https://hh.ru/vacancy/2", 50000.0, "Python"),
+    ]
+    assert records[0].salary_info["currency"] == "RUR"
+
+
+def test_ingest_items_in_chunks_keeps_order():
+    """Проверяет, что разбор пачками в нескольких процессах сохраняет порядок"""
+    items = [raw_vacancy(i, {"from": i * 1000}) for i in range(10)]
+    records = list(ingest_items(items, workers=2, chunk_size=3))
+
+    assert [r.link for r in records] == [f"https://hh.ru/vacancy/{i}" for i in range(10)]
+    assert records[5].to_vacancy().salary == 5000
+    assert VacancyRecord("Вакансия", "https://hh.ru/vacancy/1", 100.0, "").to_vacancy().normalized_salary == 100
+
+
+def test_ingest_items_reads_input_lazily():
+    """Проверяет, что вход читается не целиком, а окном в несколько пачек"""
+    consumed = []
+
+    def items():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"name": f"Вакансия {i}", "alternate_url": f"https://hh.ru/vacancy/{i}", "snippet": {}}
+
+    records = ingest_items(items(), workers=1, chunk_size=10)
+    first = next(records)
+    records.close()
+
+    assert first.link == "https://hh.ru/vacancy/0"
+    assert len(consumed) <= 30
+
+
+def test_ingest_dumps_skips_undecodable_file(tmp_path):
+    """Проверяет, что файл в неверной кодировке пропускается, а не обрывает загрузку"""
+    (tmp_path / "a_bad.json").write_bytes('[{"name": "Вакансия"}]'.encode("cp1251"))
+    (tmp_path / "b_good.json").write_text(
+        json.dumps([{"name": "Python", "alternate_url": "https://hh.ru/vacancy/1", "snippet": {}}]), encoding="utf-8"
+    )
+
+    assert [r.title for r in ingest_dumps([str(tmp_path)], workers=1)] == ["Python"]
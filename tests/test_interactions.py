@@ -1,6 +1,15 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
 import requests
 
-from src.api_interactions import HeadHunterAPI
+from src.api_interactions import AsyncHeadHunterAPI, HeadHunterAPI, RateLimiter, parse_retry_after
+from src.http_cache import ResponseCache
+from src.metrics import InMemorySink, Metrics
 
 
 def test_hh_api_connect_success():
@@ -35,3 +44,339 @@ def test_hh_api_get_vacancies_on_failure(monkeypatch):
     hh_api._connected = True
     vacancies = hh_api.get_vacancies("Python")
     assert vacancies == []
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+def test_hh_api_get_all_vacancies_in_page_order(monkeypatch):
+    """Проверяет, что все страницы загружаются через сессию и склеиваются по порядку"""
+    requested_pages = []
+
+    def mock_session_get(self, url, headers=None, params=None, timeout=None):
+        page = params.get("page", 0)
+        requested_pages.append(page)
+        return FakeResponse({"pages": 5, "items": [{"name": f"page-{page}"}]})
+
+    monkeypatch.setattr(requests.Session, "get", mock_session_get)
+    hh_api = HeadHunterAPI(max_workers=4)
+    hh_api._connected = True
+    vacancies = hh_api.get_all_vacancies("Python")
+
+    assert [v["name"] for v in vacancies] == [f"page-{i}" for i in range(5)]
+    assert sorted(requested_pages) == list(range(5))
+    assert hh_api._session is None
+
+
+def test_hh_api_get_all_vacancies_respects_depth_limit(monkeypatch):
+    """Проверяет, что запрашивается не больше 2000 вакансий"""
+    requested_pages = []
+
+    def mock_session_get(self, url, headers=None, params=None, timeout=None):
+        requested_pages.append(params.get("page", 0))
+        return FakeResponse({"pages": 50, "items": []})
+
+    monkeypatch.setattr(requests.Session, "get", mock_session_get)
+    hh_api = HeadHunterAPI()
+    hh_api._connected = True
+    hh_api.get_all_vacancies("Python")
+
+    assert sorted(requested_pages) == list(range(20))
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    """Проверяет, что ограничитель выдерживает интервал между запросами"""
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    limiter = RateLimiter(rate=10)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert len(sleeps) == 2
+    assert all(0 < s <= 0.2 for s in sleeps)
+
+
+class StubHHHandler(BaseHTTPRequestHandler):
+    """Отдаёт по 3 страницы на запрос, в каждой — одна вакансия с текстом запроса и номером страницы"""
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        text = query.get("text", [""])[0]
+        page = int(query.get("page", ["0"])[0])
+        body = json.dumps({"pages": 3, "items": [{"name": f"{text}-{page}"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHHHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/vacancies"
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_hh_api_fetch_many(stub_server):
+    """Проверяет параллельную загрузку нескольких запросов с локального сервера"""
+    hh_api = AsyncHeadHunterAPI(max_connections=4, base_url=stub_server)
+    hh_api.connect()
+    result = hh_api.get_many_vacancies(["python", "java"])
+
+    assert [v["name"] for v in result["python"]] == ["python-0", "python-1", "python-2"]
+    assert [v["name"] for v in result["java"]] == ["java-0", "java-1", "java-2"]
+
+
+def test_async_hh_api_not_connected():
+    """Проверяет, что без подключения возвращаются пустые списки"""
+    hh_api = AsyncHeadHunterAPI()
+    assert hh_api.get_vacancies("Python") == []
+
+
+def test_async_hh_api_connect_failure():
+    """Проверяет подключение к недоступному серверу"""
+    hh_api = AsyncHeadHunterAPI(base_url="http://127.0.0.1:9/vacancies")
+    hh_api.connect()
+    assert hh_api._connected is False
+
+
+def test_hh_api_iter_pages_streams_in_order(monkeypatch):
+    """Проверяет, что страницы отдаются по одной и в порядке номеров"""
+
+    def mock_session_get(self, url, headers=None, params=None, timeout=None):
+        page = params.get("page", 0)
+        return FakeResponse({"pages": 3, "items": [{"name": f"page-{page}"}]})
+
+    monkeypatch.setattr(requests.Session, "get", mock_session_get)
+    hh_api = HeadHunterAPI()
+    hh_api._connected = True
+    pages = hh_api.iter_pages("Python")
+
+    assert next(pages) == [{"name": "page-0"}]
+    assert [page[0]["name"] for page in pages] == ["page-1", "page-2"]
+
+
+class ETagHHHandler(BaseHTTPRequestHandler):
+    """Отвечает 304, если клиент прислал актуальный ETag"""
+
+    requests_log = []
+
+    def do_GET(self):
+        ETagHHHandler.requests_log.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"pages": 1, "items": [{"name": "Python"}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_hh_api_response_cache_revalidation(tmp_path):
+    """Проверяет, что свежий ответ берётся из кэша, а устаревший перепроверяется по ETag"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ETagHHHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    ETagHHHandler.requests_log = []
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/vacancies"
+        cache = ResponseCache(str(tmp_path / "cache.db"), ttl=60)
+        hh_api = HeadHunterAPI(cache=cache, base_url=base_url)
+        hh_api._connected = True
+
+        assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+        assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+        assert ETagHHHandler.requests_log == [None]
+
+        cache._ttl = 0
+        assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+        assert ETagHHHandler.requests_log == [None, '"v1"']
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_hh_api_records_http_metrics(stub_server):
+    """Проверяет, что запросы к API учитываются по статусу, времени и объёму ответа"""
+    sink = InMemorySink()
+    hh_api = HeadHunterAPI(base_url=stub_server, metrics=Metrics([sink]))
+    hh_api.connect()
+    hh_api.get_all_vacancies("python")
+
+    assert sink.counter("hh_http_requests_total", status=200) == 4
+    assert sink.summary("hh_http_request_seconds").count == 4
+    assert sink.counter("hh_http_response_bytes_total") > 0
+
+
+def test_hh_api_counts_failed_pages(monkeypatch):
+    """Проверяет, что сетевые ошибки не только печатаются, но и считаются"""
+
+    def mock_get(*args, **kwargs):
+        raise requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    sink = InMemorySink()
+    hh_api = HeadHunterAPI(metrics=Metrics([sink]), backoff_factor=0)
+    assert hh_api._fetch_page("python", 0) == {}
+
+    assert sink.counter("hh_http_errors_total", error="ConnectionError") == 4
+    assert sink.counter("hh_http_retries_total", reason="ConnectionError") == 3
+    assert sink.counter("hh_failed_pages_total") == 1
+
+
+def test_hh_api_strict_page_error_raises(monkeypatch):
+    """Проверяет, что в режиме strict ошибка страницы не превращается в пустую страницу"""
+
+    def mock_get(*args, **kwargs):
+        raise requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr(requests, "get", mock_get)
+    hh_api = HeadHunterAPI(max_retries=0)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        hh_api._fetch_page("python", 0, strict=True)
+
+
+class FaultHHHandler(BaseHTTPRequestHandler):
+    """Отдаёт заранее заданные сбои по очереди: (статус, заголовки, задержка), затем успешные ответы"""
+
+    faults = []
+    requests_count = 0
+
+    def do_GET(self):
+        FaultHHHandler.requests_count += 1
+        status, headers, delay = FaultHHHandler.faults.pop(0) if FaultHHHandler.faults else (200, {}, 0)
+        time.sleep(delay)
+        body = json.dumps({"pages": 1, "items": [{"name": "Python"}]} if status == 200 else {}).encode()
+        try:
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fault_server():
+    FaultHHHandler.faults = []
+    FaultHHHandler.requests_count = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FaultHHHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/vacancies"
+    server.shutdown()
+    server.server_close()
+
+
+def test_hh_api_retries_server_errors(fault_server):
+    """Проверяет, что 5xx повторяются, а после исчерпания попыток возвращается пустой список"""
+    sink = InMemorySink()
+    hh_api = HeadHunterAPI(base_url=fault_server, backoff_factor=0, max_retries=2, metrics=Metrics([sink]))
+    hh_api._connected = True
+
+    FaultHHHandler.faults = [(503, {}, 0), (502, {}, 0)]
+    assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+    assert sink.counter("hh_http_retries_total", reason=503) == 1
+    assert sink.counter("hh_http_retries_total", reason=502) == 1
+
+    FaultHHHandler.faults = [(500, {}, 0)] * 3
+    FaultHHHandler.requests_count = 0
+    assert hh_api.get_vacancies("Python") == []
+    assert FaultHHHandler.requests_count == 3
+
+
+def test_hh_api_honours_retry_after_and_slows_down(fault_server):
+    """Проверяет, что на 429 клиент ждёт Retry-After и снижает скорость запросов"""
+    limiter = RateLimiter(rate=50)
+    hh_api = HeadHunterAPI(base_url=fault_server, rate_limiter=limiter)
+    hh_api._connected = True
+    FaultHHHandler.faults = [(429, {"Retry-After": "0.3"}, 0)]
+
+    start = time.monotonic()
+    assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+    assert time.monotonic() - start >= 0.3
+    assert FaultHHHandler.requests_count == 2
+    assert limiter.rate < 50
+
+
+def test_hh_api_retries_timeouts(fault_server):
+    """Проверяет таймаут чтения: медленный ответ прерывается и запрос повторяется"""
+    hh_api = HeadHunterAPI(base_url=fault_server, timeout=0.2, backoff_factor=0)
+    hh_api._connected = True
+    FaultHHHandler.faults = [(200, {}, 1.0)]
+
+    start = time.monotonic()
+    assert hh_api.get_vacancies("Python") == [{"name": "Python"}]
+    assert time.monotonic() - start < 1.0
+    assert FaultHHHandler.requests_count == 2
+
+
+def test_rate_limiter_adapts_to_throttling(monkeypatch):
+    """Проверяет паузу после 429 для всех потоков, снижение скорости и её плавное восстановление"""
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    limiter = RateLimiter(rate=10, burst=5)
+    for _ in range(5):
+        limiter.acquire()
+    assert sleeps == []
+
+    limiter.on_throttle(2.0)
+    assert limiter.rate == 5
+    limiter.acquire()
+    assert 1.9 < sleeps[-1] <= 2.0
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_rate_limiter_cuts_once_per_pause(monkeypatch):
+    """Проверяет, что 429 от параллельных запросов снижают скорость один раз за паузу"""
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    limiter = RateLimiter(rate=20)
+    for _ in range(8):
+        limiter.on_throttle(2.0)
+    assert limiter.rate == 10
+
+    unlimited = RateLimiter()
+    for _ in range(8):
+        unlimited.acquire()
+    unlimited.on_throttle(1.0)
+    assert unlimited.rate == 4
+
+
+def test_parse_retry_after():
+    """Проверяет разбор Retry-After в секундах и в виде HTTP-даты"""
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("не число") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,91 @@
+import pstats
+
+import pytest
+import requests
+
+import src.main
+from src.indexes import SalaryIndex
+from src.main import get_top_vacancies, get_top_vacancies_by_salary, get_vacancies_by_salary, sort_vacancies
+from src.vacancies import Vacancy
+
+
+def make_vacancies():
+    salaries = [120000, 0, 80000, 200000, 120000]
+    return [Vacancy(f"Вакансия {i}", f"https://hh.ru/vacancy/{i}", str(s), "") for i, s in enumerate(salaries)]
+
+
+def test_get_top_vacancies_by_salary_matches_sort():
+    """Проверяет, что выбор топа кучей совпадает с сортировкой и срезом"""
+    vacancies = make_vacancies()
+    expected = get_top_vacancies(sort_vacancies(vacancies), 3)
+
+    assert [v.title for v in get_top_vacancies_by_salary(iter(vacancies), 3)] == [v.title for v in expected]
+
+
+def test_get_vacancies_by_salary_with_index():
+    """Проверяет, что поиск по индексу даёт тот же результат, что и проход по списку"""
+    vacancies = make_vacancies()
+    index = SalaryIndex.from_vacancies(vacancies)
+
+    for threshold in ("0", "100000", "200000"):
+        indexed = get_vacancies_by_salary(vacancies, threshold, index=index)
+        assert [v.title for v in indexed] == [v.title for v in get_vacancies_by_salary(vacancies, threshold)]
+
+
+def test_sort_vacancies_normalises_currency():
+    """Проверяет, что зарплаты в разных валютах сравниваются после перевода в рубли"""
+    vacancies = [
+        Vacancy("Рубли", "https://hh.ru/vacancy/1", {"from": 150000, "currency": "RUR"}, ""),
+        Vacancy("Доллары", "https://hh.ru/vacancy/2", {"from": 3000, "currency": "USD"}, ""),
+        Vacancy("До", "https://hh.ru/vacancy/3", "до 120000", ""),
+    ]
+
+    assert [v.title for v in sort_vacancies(vacancies)] == ["Доллары", "Рубли", "До"]
+    assert [v.title for v in get_vacancies_by_salary(vacancies, "100000")] == ["Рубли", "Доллары", "До"]
+
+
+def test_main_profile_and_metrics_file(tmp_path, monkeypatch):
+    """Проверяет, что CLI сохраняет профиль cProfile и файл метрик"""
+    calls = []
+
+    def fake_interaction(metrics):
+        metrics.inc("hh_http_requests_total", status=200)
+        calls.append(metrics)
+
+    monkeypatch.setattr(src.main, "user_interaction", fake_interaction)
+    profile, metrics_file = tmp_path / "run.prof", tmp_path / "metrics.prom"
+    src.main.main(["--profile", str(profile), "--metrics-file", str(metrics_file)])
+
+    assert len(calls) == 1
+    assert pstats.Stats(str(profile)).total_calls > 0
+    assert 'hh_http_requests_total{status="200"} 1' in metrics_file.read_text(encoding="utf-8")
+
+
+def test_user_interaction_uses_one_session(tmp_path, monkeypatch):
+    """Проверяет, что проверка подключения и загрузка страниц идут через одну keep-alive сессию"""
+    sessions = []
+
+    class FakeResponse:
+        status_code = 200
+        headers = {}
+        content = b""
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"pages": 1, "items": []}
+
+    def mock_session_get(self, url, headers=None, params=None, timeout=None):
+        sessions.append(id(self))
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "get", mock_session_get)
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: pytest.fail("запрос мимо сессии"))
+    answers = iter(["python", "5", "", ""])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+    monkeypatch.chdir(tmp_path)
+
+    src.main.user_interaction()
+    assert len(sessions) == 2
+    assert len(set(sessions)) == 1
@@ -0,0 +1,67 @@
+import time
+
+from src.filehandler import JSONSaver
+from src.metrics import InMemorySink, Metrics, PrometheusFileSink
+from src.vacancies import Vacancy
+
+
+def test_metrics_disabled_passes_through():
+    """Проверяет, что без приёмников стадии не оборачиваются и ничего не записывается"""
+    metrics = Metrics()
+    items = [1, 2, 3]
+    assert metrics.timed_stage("fetch", items) is items
+    with metrics.timer("block"):
+        metrics.inc("requests_total")
+    assert metrics.enabled is False
+
+
+def test_metrics_stage_times_exclude_upstream():
+    """Проверяет, что у стадии конвейера не учитывается время стадии, из которой она берёт элементы"""
+    sink = InMemorySink()
+    metrics = Metrics([sink])
+
+    def slow_source():
+        for i in range(3):
+            time.sleep(0.02)
+            yield i
+
+    source = metrics.timed_stage("fetch", slow_source())
+    doubled = metrics.timed_stage("parse", (i * 2 for i in source))
+    with metrics.timer("pipeline_stage_seconds", stage="filter"):
+        assert list(doubled) == [0, 2, 4]
+
+    assert sink.summary("pipeline_stage_seconds", stage="fetch").total >= 0.06
+    assert sink.summary("pipeline_stage_seconds", stage="parse").total < 0.02
+    assert sink.summary("pipeline_stage_seconds", stage="filter").total < 0.02
+    assert sink.counter("pipeline_stage_items_total", stage="parse") == 3
+
+
+def test_prometheus_file_sink(tmp_path):
+    """Проверяет выгрузку в текстовом формате Prometheus"""
+    filename = tmp_path / "metrics.prom"
+    sink = PrometheusFileSink(str(filename))
+    metrics = Metrics([sink])
+    metrics.inc("hh_http_requests_total", status=200)
+    metrics.inc("hh_http_requests_total", status=200)
+    metrics.observe("hh_http_request_seconds", 0.5)
+    metrics.set_gauge("storage_file_bytes", 1024, storage='js"on')
+    metrics.flush()
+
+    lines = filename.read_text(encoding="utf-8").splitlines()
+    assert "# TYPE hh_http_requests_total counter" in lines
+    assert 'hh_http_requests_total{status="200"} 2' in lines
+    assert 'storage_file_bytes{storage="js\\"on"} 1024' in lines
+    assert "hh_http_request_seconds_count 1" in lines
+    assert "hh_http_request_seconds_sum 0.5" in lines
+
+
+def test_json_saver_records_storage_metrics(tmp_path):
+    """Проверяет, что JSONSaver пишет длительности чтения и записи и размер файла"""
+    sink = InMemorySink()
+    saver = JSONSaver(str(tmp_path / "vacancies.json"), metrics=Metrics([sink]))
+    saver.add_vacancy(Vacancy("Python Developer", "https://example.com/1", "100000", "Описание"))
+    saver.get_vacancies()
+
+    assert sink.summary("storage_load_seconds", storage="json").count == 2
+    assert sink.summary("storage_save_seconds", storage="json").count == 1
+    assert sink.gauge("storage_file_bytes", storage="json") == (tmp_path / "vacancies.json").stat().st_size
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from src.salary import ExchangeRates, Salary, normalized_amount
+
+
+@pytest.fixture
+def rates():
+    return ExchangeRates({"USD": 90.0, "EUR": 100.0})
+
+
+def test_salary_from_raw_dict():
+    """Проверяет разбор зарплаты из ответа hh.ru"""
+    salary = Salary.from_raw({"from": None, "to": 3000, "currency": "USD", "gross": True})
+    assert (salary.salary_from, salary.salary_to, salary.currency, salary.gross) == (None, 3000, "USD", True)
+    assert salary.amount == 3000
+
+
+def test_salary_from_raw_text():
+    """Проверяет разбор текстовых зарплат, включая «до» и валюту"""
+    assert Salary.from_raw("от 100 000 руб.").salary_from == 100000
+    upto = Salary.from_raw("до 150000")
+    assert (upto.salary_from, upto.salary_to, upto.currency) == (None, 150000, "RUR")
+    fork = Salary.from_raw("2000-3000 USD")
+    assert (fork.salary_from, fork.salary_to, fork.currency) == (2000, 3000, "USD")
+    fork = Salary.from_raw("от 2 000 до 3 000 USD")
+    assert (fork.salary_from, fork.salary_to, fork.currency) == (2000, 3000, "USD")
+    assert Salary.from_raw("не указана").amount == 0.0
+    assert Salary.from_raw(None).amount == 0.0
+
+
+def test_salary_str():
+    """Проверяет вывод вилки с валютой"""
+    assert str(Salary.from_raw("от 100 000 руб.")) == "от 100000 руб."
+    assert str(Salary(100000, 150000)) == "от 100000 до 150000 руб."
+    assert str(Salary(None, 3000, "USD")) == "до 3000 USD"
+    assert str(Salary()) == "Не указана"
+
+
+def test_salary_normalized(rates):
+    """Проверяет перевод в базовую валюту, синонимы кодов и неизвестные валюты"""
+    assert Salary(2000, currency="USD").normalized(rates) == 180000
+    assert Salary(100000, currency="RUB").normalized(rates) == 100000
+    assert Salary(100000, currency="XYZ").normalized(rates) == 0.0
+    assert normalized_amount({"from": None, "to": 1000, "currency": "EUR"}, rates) == 100000
+
+
+def test_exchange_rates_from_file(tmp_path):
+    """Проверяет загрузку таблицы курсов из файла и таблицу по умолчанию"""
+    filename = tmp_path / "rates.json"
+    filename.write_text(json.dumps({"base": "USD", "rates": {"RUR": 0.01}}))
+    rates = ExchangeRates.from_file(str(filename))
+
+    assert rates.convert(100000, "RUR") == pytest.approx(1000)
+    assert rates.convert(5, "USD") == 5
+    assert ExchangeRates.default().convert(1, "RUR") == 1
@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from src.filehandler import JSONSaver
+from src.snapshot import VacancySnapshot, write_snapshot
+from src.vacancies import Vacancy
+
+
+@pytest.fixture
+def vacancies():
+    return [
+        Vacancy("Python разработчик", "https://hh.ru/vacancy/1", {"from": 100000, "to": 150000}, "Опыт с Django"),
+        Vacancy(
+            "Java разработчик", "https://hh.ru/vacancy/2", {"to": 3000, "currency": "USD", "gross": True}, "Spring"
+        ),
+        Vacancy("Тестировщик", "https://hh.ru/vacancy/3", None, "Ручное тестирование — «ёлки»"),
+    ]
+
+
+def test_snapshot_round_trip(tmp_path, vacancies):
+    """Проверяет запись снимка и чтение произвольной записи через mmap"""
+    filename = str(tmp_path / "vacancies.snap")
+    assert write_snapshot(filename, vacancies) == 3
+
+    with VacancySnapshot(filename) as snapshot:
+        assert len(snapshot) == 3
+        assert snapshot.currencies == ["RUR", "USD"]
+        java = snapshot[1]
+        assert java.title == "Java разработчик"
+        assert java.link == "https://hh.ru/vacancy/2"
+        assert java.salary_info.to_dict() == {"from": None, "to": 3000.0, "currency": "USD", "gross": True}
+        assert snapshot[2].description == "Ручное тестирование — «ёлки»"
+        assert [v.link for v in snapshot] == [v.link for v in vacancies]
+        assert math.isnan(snapshot.salary_from[2])
+        with pytest.raises(IndexError):
+            snapshot[3]
+
+
+def test_snapshot_salary_scan(tmp_path, vacancies):
+    """Проверяет векторный отбор по зарплате в базовой валюте"""
+    filename = str(tmp_path / "vacancies.snap")
+    write_snapshot(filename, vacancies)
+
+    with VacancySnapshot(filename) as snapshot:
+        assert snapshot.normalized_salary.tolist() == [v.normalized_salary for v in vacancies]
+        assert snapshot.rows_by_salary(min_salary=1).tolist() == [0, 1]
+        assert [v.title for v in snapshot.get_vacancies(0, 150000)] == ["Python разработчик", "Тестировщик"]
+
+
+def test_snapshot_empty_and_invalid(tmp_path):
+    """Проверяет пустой снимок и отказ открывать файл другого формата"""
+    filename = str(tmp_path / "empty.snap")
+    write_snapshot(filename, [])
+    with VacancySnapshot(filename) as snapshot:
+        assert len(snapshot) == 0
+        assert snapshot.rows_by_salary(0).tolist() == []
+
+    other = tmp_path / "other.snap"
+    other.write_bytes(b"\x00" * 128)
+    with pytest.raises(ValueError):
+        VacancySnapshot(str(other))
+
+
+def test_file_handler_export_snapshot(tmp_path, vacancies):
+    """Проверяет выгрузку хранилища в снимок и открытие через FileHandler"""
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancies(vacancies)
+    filename = str(tmp_path / "vacancies.snap")
+
+    assert saver.export_snapshot(filename) == 3
+    with saver.open_snapshot(filename) as snapshot:
+        assert [v.link for v in snapshot] == [v.link for v in saver.get_vacancies()]
+
+
+def test_snapshot_close_with_live_views(tmp_path, vacancies):
+    """Проверяет, что close() не падает, пока у вызывающего остаются представления колонок"""
+    filename = str(tmp_path / "vacancies.snap")
+    write_snapshot(filename, vacancies)
+
+    with VacancySnapshot(filename) as snapshot:
+        column = snapshot.normalized_salary
+        head = snapshot.salary[:2]
+    assert column.tolist() == [v.normalized_salary for v in vacancies]
+    assert head.tolist() == [v.salary for v in vacancies[:2]]
+
+
+def test_snapshot_closed_and_aligned(tmp_path, vacancies):
+    """Проверяет выравнивание колонки валют при нечётном числе записей и ошибку при чтении закрытого снимка"""
+    filename = str(tmp_path / "vacancies.snap")
+    write_snapshot(filename, vacancies)
+
+    snapshot = VacancySnapshot(filename)
+    assert len(snapshot) % 2 == 1
+    assert snapshot.currency_codes.flags.aligned
+    assert [snapshot.currencies[code] for code in snapshot.currency_codes] == [
+        v.salary_info.currency for v in vacancies
+    ]
+    snapshot.close()
+    snapshot.close()
+    with pytest.raises(ValueError):
+        snapshot[0]
+    with pytest.raises(ValueError):
+        snapshot.get_vacancies()
@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from src.filehandler import JSONSaver
+from src.sync import HH_DATE_FORMAT, VacancySync
+
+
+def days_ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime(HH_DATE_FORMAT)
+
+
+def raw_vacancy(vacancy_id, published_at, archived=False):
+    return {
+        "id": vacancy_id,
+        "name": f"Вакансия {vacancy_id}",
+        "alternate_url": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": None,
+        "snippet": {"requirement": "Python"},
+        "published_at": published_at,
+        "archived": archived,
+    }
+
+
+def parse(value):
+    return datetime.strptime(value, HH_DATE_FORMAT)
+
+
+class FakeAPI:
+    """Отдаёт заданные вакансии как hh.ru (от новых к старым, не больше MAX_DEPTH) и запоминает параметры запросов"""
+
+    MAX_DEPTH = 2000
+
+    def __init__(self):
+        self.items = []
+        self.calls = []
+        self.fail = False
+
+    def iter_vacancies(self, search_query, extra_params=None, strict=False):
+        self.calls.append(extra_params)
+        if self.fail:
+            raise requests.exceptions.ConnectionError()
+        params = extra_params or {}
+        items = [
+            item
+            for item in self.items
+            if ("date_from" not in params or parse(item["published_at"]) >= parse(params["date_from"]))
+            and ("date_to" not in params or parse(item["published_at"]) <= parse(params["date_to"]))
+        ]
+        if params.get("order_by") == "publication_time":
+            items.sort(key=lambda item: parse(item["published_at"]), reverse=True)
+        yield from items[:self.MAX_DEPTH]
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JSONSaver(str(tmp_path / "vacancies.json"))
+
+
+def test_sync_fetches_only_new_vacancies(storage, tmp_path):
+    """Проверяет, что повторная синхронизация запрашивает date_from и не считает границу новой"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(2)), raw_vacancy("2", days_ago(1))]
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"))
+
+    assert sync.sync("python") == 2
+    assert len(api.calls) == 1 and api.calls[0]["order_by"] == "publication_time"
+    high_water_mark = sync.high_water_mark("python")
+
+    api.items.append(raw_vacancy("3", days_ago(0)))
+    assert VacancySync(api, storage, str(tmp_path / "state.json")).sync("python") == 1
+    assert api.calls[1] == {"order_by": "publication_time", "date_from": high_water_mark}
+    assert len(storage.get_vacancies()) == 3
+
+
+def test_sync_skips_previous_boundary_when_newer_arrives_first(storage, tmp_path):
+    """Проверяет, что граница прошлого запуска не считается новой, даже если более свежая вакансия пришла раньше"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(2))]
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"))
+    assert sync.sync("python") == 1
+
+    api.items = [raw_vacancy("2", days_ago(1)), raw_vacancy("1", api.items[0]["published_at"])]
+    assert sync.sync("python") == 1
+    assert len(storage.get_vacancies()) == 2
+
+
+def test_sync_counts_only_stored_vacancies(storage, tmp_path):
+    """Проверяет, что вакансии, уже лежащие в хранилище, не считаются новыми"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(2)), raw_vacancy("2", days_ago(1))]
+    VacancySync(api, storage, str(tmp_path / "first.json")).sync("python")
+
+    assert VacancySync(api, storage, str(tmp_path / "second.json")).sync("python") == 0
+
+
+def test_sync_pages_past_depth_limit_by_date_to(storage, tmp_path):
+    """Проверяет, что выдача больше MAX_DEPTH дочитывается окнами по date_to"""
+    api = FakeAPI()
+    api.MAX_DEPTH = 2
+    api.items = [raw_vacancy(str(day), days_ago(day)) for day in range(1, 6)]
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"))
+
+    assert sync.sync("python") == 5
+    assert api.calls[1]["date_to"] == api.items[1]["published_at"]
+    assert sync.high_water_mark("python") == api.items[0]["published_at"]
+
+
+def test_sync_keeps_mark_when_results_incomplete(storage, tmp_path):
+    """Проверяет, что отметка не сдвигается, если выдачу не удалось прочитать целиком"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(3))]
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"))
+    sync.sync("python")
+    high_water_mark = sync.high_water_mark("python")
+
+    api.MAX_DEPTH = 2
+    same_time = days_ago(1)
+    api.items += [raw_vacancy(str(i), same_time) for i in range(2, 5)]
+    sync.sync("python")
+    assert sync.high_water_mark("python") == high_water_mark
+
+    api.fail = True
+    assert sync.sync("python") == 0
+    assert sync.high_water_mark("python") == high_water_mark
+
+
+def test_sync_first_run_starts_from_max_age(storage, tmp_path):
+    """Проверяет, что первая синхронизация не запрашивает вакансии старше max_age_days"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(40)), raw_vacancy("2", days_ago(5))]
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"), max_age_days=30)
+
+    assert sync.sync("python") == 1
+    assert parse(days_ago(31)) < parse(api.calls[0]["date_from"]) <= parse(days_ago(30))
+    assert [v.link for v in storage.get_vacancies()] == ["https://hh.ru/vacancy/2"]
+
+    VacancySync(api, storage, str(tmp_path / "unbounded.json"), max_age_days=None).sync("python")
+    assert "date_from" not in api.calls[1]
+
+
+def test_sync_expires_old_and_archived(storage, tmp_path):
+    """Проверяет удаление архивных вакансий и вакансий старше max_age_days"""
+    api = FakeAPI()
+    api.items = [raw_vacancy("1", days_ago(5)), raw_vacancy("2", days_ago(2)), raw_vacancy("3", days_ago(1))]
+    assert VacancySync(api, storage, str(tmp_path / "state.json"), max_age_days=30).sync("python") == 3
+
+    sync = VacancySync(api, storage, str(tmp_path / "state.json"), max_age_days=3)
+    sync.sync("python")
+    assert sorted(v.link for v in storage.get_vacancies()) == ["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/3"]
+
+    api.items = [raw_vacancy("3", days_ago(1), archived=True)]
+    sync.sync("python")
+    assert [v.link for v in storage.get_vacancies()] == ["https://hh.ru/vacancy/2"]
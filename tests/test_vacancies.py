@@ -85,13 +85,78 @@ def test_vacancy_comparison():
     assert v2 > v1
 
 
+def test_vacancy_comparison_uses_base_currency():
+    """Проверяет, что сравнение и sorted учитывают валюту так же, как sort_vacancies"""
+    dollars = Vacancy("Доллары", "https://ex.com/1", {"from": 3000, "currency": "USD"}, "")
+    roubles = Vacancy("Рубли", "https://ex.com/2", {"from": 150000, "currency": "RUR"}, "")
+
+    assert roubles < dollars
+    assert [v.title for v in sorted([dollars, roubles], reverse=True)] == ["Доллары", "Рубли"]
+
+
 def test_vacancy_str():
     """Проверяет строковое представление вакансии"""
     vacancy = Vacancy("Python Developer", "https://example.com    ", "100000-150000 руб.", "Описание: опыт от 3 лет...")
     expected = (
         "Python Developer\n"
         "Ссылка: https://example.com    \n"
-        "Зарплата: 100000 руб.\n"
+        "Зарплата: от 100000 до 150000 руб.\n"
         "Описание: Описание: опыт от 3 лет..."
     )
-    assert str(vacancy) == expected
\ No newline at end of file
+    assert str(vacancy) == expected
+
+
+def test_vacancy_str_shows_currency():
+    """Проверяет, что зарплата в валюте выводится с кодом валюты, а не в рублях"""
+    vacancy = Vacancy("Go Developer", "https://example.com/1", {"from": 3000, "currency": "USD"}, "Описание")
+    assert "Зарплата: от 3000 USD\n" in str(vacancy)
+
+
+def test_iter_from_raw_is_lazy():
+    """Проверяет, что iter_from_raw не читает исходные данные заранее"""
+    consumed = []
+
+    def raw_items():
+        for i in range(3):
+            consumed.append(i)
+            yield {"name": f"Вакансия {i}", "alternate_url": f"https://hh.ru/vacancy/{i}", "snippet": {}}
+
+    vacancies = Vacancy.iter_from_raw(raw_items())
+    assert consumed == []
+    assert next(vacancies).title == "Вакансия 0"
+    assert consumed == [0]
+    assert len(list(vacancies)) == 2
+
+
+def test_salary_parsing_numeric():
+    """Проверяет, что числовая зарплата из хранилища сохраняется при повторной загрузке"""
+    assert Vacancy._parse_salary(120000.0) == 120000
+    assert Vacancy._parse_salary(90000) == 90000
+
+
+def test_vacancy_from_record_roundtrip():
+    """Проверяет быстрое восстановление вакансии из записи хранилища"""
+    original = Vacancy("Python Developer", "https://hh.ru/vacancy/1", {"to": 3000, "currency": "USD"}, "Описание")
+    record = {
+        "title": original.title,
+        "link": original.link,
+        "salary": original.salary,
+        "description": original.description,
+        "salary_info": original.salary_info.to_dict(),
+    }
+    restored = Vacancy.from_record(record)
+
+    assert (restored.title, restored.link, restored.salary) == ("Python Developer", "https://hh.ru/vacancy/1", 3000)
+    assert restored.salary_info.currency == "USD"
+    assert restored.normalized_salary == original.normalized_salary
+
+
+def test_vacancy_interns_repeated_values():
+    """Проверяет, что одинаковые названия и валюты хранятся одним объектом строки"""
+    first = Vacancy.from_trusted("".join(["Бух", "галтер"]), "https://hh.ru/vacancy/1", 0.0, "")
+    usd = {"from": 1, "currency": "".join(["U", "SD"])}
+    second = Vacancy("".join(["Бухгал", "тер"]), "https://hh.ru/vacancy/2", usd, "")
+    third = Vacancy("Аналитик", "https://hh.ru/vacancy/3", {"from": 1, "currency": "".join(["US", "D"])}, "")
+
+    assert first.title is second.title
+    assert second.salary_info.currency is third.salary_info.currency
@@ -0,0 +1,79 @@
+from src.salary import ExchangeRates
+from src.vacancies import Vacancy
+from src.vacancy_table import VacancyTable
+
+
+def make_raw_data():
+    salaries = [
+        {"from": 100000, "to": 150000, "currency": "RUR"},
+        None,
+        {"to": 3000, "currency": "USD"},
+        {"from": 200000, "currency": "RUR"},
+        {"from": 100000, "currency": "RUR"},
+    ]
+    data = [
+        {"name": f"Вакансия {i}", "alternate_url": f"https://hh.ru/vacancy/{i}", "salary": s, "snippet": {}}
+        for i, s in enumerate(salaries)
+    ]
+    data.append({"name": "", "alternate_url": "https://hh.ru/vacancy/99", "salary": None, "snippet": {}})
+    return data
+
+
+def test_vacancy_table_from_raw_matches_objects():
+    """Проверяет, что таблица отбирает и разбирает вакансии так же, как cast_to_object_list"""
+    raw = make_raw_data()
+    table = VacancyTable.from_raw(raw)
+    vacancies = Vacancy.cast_to_object_list(raw)
+
+    assert len(table) == len(vacancies) == 5
+    assert table.salary.tolist() == [v.salary for v in vacancies]
+    assert table.currencies == ["RUR", "USD"]
+    assert [v.salary_info.to_dict() for v in table.to_vacancies()] == [v.salary_info.to_dict() for v in vacancies]
+
+
+def test_vacancy_table_filter_and_sort():
+    """Проверяет векторный фильтр по зарплате и валюте и стабильную сортировку"""
+    table = VacancyTable.from_raw(make_raw_data())
+    rates = ExchangeRates({"USD": 90.0})
+
+    assert [v.title for v in table.filter_by_salary(100000, 150000, rates=rates).to_vacancies()] == [
+        "Вакансия 0",
+        "Вакансия 4",
+    ]
+    assert [v.title for v in table.filter_by_salary(250000, rates=rates).to_vacancies()] == ["Вакансия 2"]
+    assert len(table.filter_by_salary(exclude_zero=True, rates=rates)) == 4
+    assert [v.title for v in table.filter_by_currency("USD").to_vacancies()] == ["Вакансия 2"]
+    assert len(table.filter_by_currency("EUR")) == 0
+    assert table.sort_by_salary(rates=rates).salary.tolist() == [3000, 200000, 100000, 100000, 0]
+
+
+def test_vacancy_table_top_matches_stable_sort():
+    """Проверяет, что топ совпадает со срезом стабильной сортировки, в том числе при равных зарплатах"""
+    table = VacancyTable.from_raw(make_raw_data())
+    expected = sorted(table.to_vacancies(), key=lambda v: v.normalized_salary, reverse=True)
+
+    for n in range(0, 7):
+        assert [v.title for v in table.top(n)] == [v.title for v in expected[:n]]
+
+
+def test_vacancy_table_normalized_salary():
+    """Проверяет векторный перевод зарплат в базовую валюту и валюту у созданных объектов"""
+    table = VacancyTable.from_raw(make_raw_data())
+    rates = ExchangeRates({"USD": 90.0})
+
+    assert table.normalized_salary(rates).tolist() == [100000, 0, 270000, 200000, 100000]
+    assert table[2].salary_info.currency == "USD"
+    assert table[2].normalized_salary == table.normalized_salary()[2]
+
+
+def test_vacancy_table_from_vacancies_keeps_salary_info():
+    """Проверяет, что таблица из объектов сохраняет вилку и валюту, а «до» не превращается в «от»"""
+    vacancies = [
+        Vacancy("Рубли", "https://hh.ru/vacancy/1", {"to": 200000, "currency": "RUR"}, ""),
+        Vacancy("Евро", "https://hh.ru/vacancy/2", {"from": 2000, "currency": "EUR", "gross": False}, ""),
+    ]
+    table = VacancyTable.from_vacancies(vacancies)
+
+    assert table.currencies == ["RUR", "EUR"]
+    assert [v.salary_info.to_dict() for v in table.to_vacancies()] == [v.salary_info.to_dict() for v in vacancies]
+    assert [v.title for v in table.top(1, ExchangeRates({"EUR": 100.0}))] == ["Рубли"]